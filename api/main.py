@@ -338,6 +338,37 @@ def get_last_played_match() -> dict[str, Any]:
     return {"found": True, "item": item}
 
 
+@app.get("/matches/report")
+def get_match_report(match_key: str) -> dict[str, Any]:
+    """
+    Uložený detail reportu zápasu (title + HTML + text) podľa match_key.
+    """
+    sql = """
+        SELECT match_key, report_url, title, content_html, content_text, updated_at
+        FROM match_reports
+        WHERE match_key = %s
+        LIMIT 1
+    """
+
+    with db.conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, (match_key,))
+            r = cur.fetchone()
+
+    if not r:
+        return {"found": False, "item": None}
+
+    item = {
+        "match_key": r[0],
+        "report_url": r[1],
+        "title": r[2],
+        "content_html": r[3],
+        "content_text": r[4],
+        "updated_at": r[5],
+    }
+    return {"found": True, "item": item}
+
+
 @app.get("/home")
 def home_payload(
     articles_limit: int = Query(6, ge=1, le=30),
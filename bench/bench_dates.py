@@ -0,0 +1,90 @@
+"""
+Mikrobenchmark utils.dates: fuzzy dateutil vs. rýchla cesta vs. rýchla cesta + LRU.
+
+    python bench/bench_dates.py [--repeat 2000]
+
+Zároveň overí, že rýchla cesta vracia pre číselné formáty to isté čo dateutil
+(slovenské mená mesiacov dateutil nepozná – tam bol jeho výsledok None alebo zlý dátum).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dateutil import parser as dateparser  # noqa: E402
+
+from utils.dates import _NUMERIC_RE, _fast_parse, parse_datetime_safe  # noqa: E402
+
+# reťazce v tvare, v akom prichádzajú z kariet, PRIDANÉ: riadkov a bannerov zápasov
+SAMPLES = [
+    "25.11.2025",
+    "1.1.2025",
+    "24.\xa011.\xa02025",
+    "PRIDANÉ: 24.11.2025",
+    "Pridané: 3. 2. 2025",
+    "utorok 25.11.2025 18:00",
+    "utorok 25.11.2025, 18:00",
+    "sobota 22.11.2025 17:00",
+    "18.11.2025 o 18:30 hod.",
+    "1.1.2025 9:05",
+    "25.11.2025 18:00:30",
+    "25. novembra 2025",
+    "3. mája 2025 17:30",
+    "31.02.2025",
+    "nejaký text bez dátumu",
+    "22. kolo 25.11.2025",
+]
+
+
+def _dateutil(value: str) -> str | None:
+    try:
+        dt = dateparser.parse(value, dayfirst=True, fuzzy=True)
+        return dt.isoformat() if dt else None
+    except Exception:
+        return None
+
+
+def _bench(fn, values: list[str], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for v in values:
+            fn(v)
+    return (time.perf_counter() - t0) / (repeat * len(values)) * 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=2000)
+    args = ap.parse_args()
+
+    mismatches = 0
+    for v in SAMPLES:
+        fast, slow = _fast_parse(v), _dateutil(v)
+        if fast is not False and slow is not None and fast != slow and _NUMERIC_RE.match(v):
+            mismatches += 1
+            print(f"ROZDIEL {v!r}: rýchla={fast!r} dateutil={slow!r}")
+        print(f"{v!r:<32} -> {parse_datetime_safe(v)!r}{'' if fast is not False else '  (dateutil)'}")
+
+    uncached = parse_datetime_safe.__wrapped__
+    fast_only = [v for v in SAMPLES if _fast_parse(v) is not False]
+    rows = [
+        ("dateutil fuzzy", _bench(_dateutil, fast_only, args.repeat)),
+        ("rýchla cesta", _bench(uncached, fast_only, args.repeat)),
+        ("rýchla cesta + LRU", _bench(parse_datetime_safe, fast_only, args.repeat)),
+    ]
+    print()
+    base = rows[0][1]
+    for name, us in rows:
+        print(f"{name:<20} {us:8.2f} µs/dátum  ({base / us:5.1f}x)")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+"""
+Mikrobenchmark parserov nad fixtures v bench/fixtures a ich syntetickými zväčšeninami.
+
+    python bench/bench_parsers.py                    # porovná s bench/baseline.json
+    python bench/bench_parsers.py --save-baseline    # prepíše baseline aktuálnym meraním
+    python bench/bench_parsers.py --only zapasy --repeat 50 --backend bs4
+
+Pre každý prípad vypíše čas (najlepší z opakovaní), čas na položku a na KB vstupu a Python-heap
+peak (tracemalloc, po zahrievacom volaní – bez jednorazových cache a lazy importov).
+Regresia = čas nad baseline o viac ako --threshold (predvolene 50 %, časy na zdieľanom stroji
+kolíšu) alebo peak o viac ako --mem-threshold (10 %, peak je stabilnejší, no závisí aj od
+verzií knižníc a interpretera); návratový kód 1. Časy v baseline platia pre stroj, na ktorom vznikli –
+po zmene stroja ju treba prepísať (--save-baseline, pre každý backend zvlášť).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from parsers.article_type1 import parse_article_type1  # noqa: E402
+from parsers.article_type2 import parse_article_type2  # noqa: E402
+from parsers.backend import available_backends, get_backend, set_backend  # noqa: E402
+from parsers.novinky import parse_novinky_list  # noqa: E402
+from parsers.zapasy import parse_matches  # noqa: E402
+from parsers.zapasy_api import parse_matches_api_json  # noqa: E402
+from parsers.zapasy_reporty import parse_match_reports  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+BASE_URL = "https://www.hckosice.sk"
+_MIN_SECONDS = 0.3
+
+_MATCH_ITEM_RE = re.compile(r'^    <div class="matches-list__item">.*?^    </div>\n', re.M | re.S)
+_CARD_RE = re.compile(r'^      <li class="article.*?</li>\n', re.M | re.S)
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _scale_items(html: str, item_re: re.Pattern, count: int) -> str:
+    """
+    Položky zoznamu (item_re) sa zopakujú dookola na `count` kusov – vložia sa
+    na miesto pôvodných položiek posledného kontajnera (played tab / articles-list).
+    """
+    matches = list(item_re.finditer(html))
+    # posledný súvislý blok položiek = posledný kontajner
+    block = [matches[-1]]
+    for m in reversed(matches[:-1]):
+        if m.end() != block[0].start():
+            break
+        block.insert(0, m)
+    items = [m.group(0) for m in block]
+    start, end = block[0].start(), block[-1].end()
+    scaled = "".join(items[i % len(items)] for i in range(count))
+    return html[:start] + scaled + html[end:]
+
+
+def _scale_body(html: str, start: str, end: str, size: int) -> str:
+    """
+    Obsah medzi `start` a `end` (telo článku) sa opakuje, kým dokument nemá aspoň `size` bajtov.
+    """
+    i = html.index(start) + len(start)
+    j = html.index(end, i)
+    chunk = html[i:j]
+    copies = max(1, -(-(size - len(html.encode("utf-8"))) // max(1, len(chunk.encode("utf-8")))) + 1)
+    return html[:i] + chunk * copies + html[j:]
+
+
+def _scale_api(payload: str, count: int) -> str:
+    items = json.loads(payload)
+    return json.dumps([items[i % len(items)] for i in range(count)], ensure_ascii=False)
+
+
+def _type1_200kb() -> str:
+    return _scale_body(
+        _fixture("article_type1.html"), '<div class="match-article block block--primary">', "  </div>\n</main>", 200 * 1024
+    )
+
+
+def _type2_200kb() -> str:
+    return _scale_body(_fixture("article_type2.html"), 'class="clearfix  text-formatted field">', "    </div>\n  </main>", 200 * 1024)
+
+
+# prípad -> (vstup, parser)
+CASES: dict[str, tuple[Callable[[], str], Callable[[str], object]]] = {
+    "article_type1": (lambda: _fixture("article_type1.html"), lambda h: parse_article_type1(h, BASE_URL)),
+    "article_type1_200kb": (_type1_200kb, lambda h: parse_article_type1(h, BASE_URL)),
+    "article_type2": (lambda: _fixture("article_type2.html"), lambda h: parse_article_type2(h, BASE_URL)),
+    "article_type2_200kb": (_type2_200kb, lambda h: parse_article_type2(h, BASE_URL)),
+    "novinky": (lambda: _fixture("novinky.html"), lambda h: parse_novinky_list(h, BASE_URL, limit=1000)),
+    "novinky_200": (
+        lambda: _scale_items(_fixture("novinky.html"), _CARD_RE, 200),
+        lambda h: parse_novinky_list(h, BASE_URL, limit=1000),
+    ),
+    "zapasy": (lambda: _fixture("zapasy.html"), lambda h: parse_matches(h, BASE_URL)),
+    "zapasy_500": (lambda: _scale_items(_fixture("zapasy.html"), _MATCH_ITEM_RE, 500), lambda h: parse_matches(h, BASE_URL)),
+    "zapasy_reporty": (lambda: _fixture("zapasy.html"), lambda h: parse_match_reports(h, BASE_URL)),
+    "zapasy_reporty_500": (
+        lambda: _scale_items(_fixture("zapasy.html"), _MATCH_ITEM_RE, 500),
+        lambda h: parse_match_reports(h, BASE_URL),
+    ),
+    "zapasy_api": (lambda: _fixture("zapasy_api.json"), parse_matches_api_json),
+    "zapasy_api_5000": (lambda: _scale_api(_fixture("zapasy_api.json"), 5000), parse_matches_api_json),
+}
+
+
+def _measure(fn: Callable[[str], object], data: str, repeat: int) -> tuple[float, int, int]:
+    """
+    (najlepší čas na volanie v sekundách, peak bajtov, počet položiek výstupu).
+    Meria sa aspoň `repeat`-krát a aspoň _MIN_SECONDS, aby malé vstupy nešumeli.
+    """
+    fn(data)  # zahriatie: prvé volanie plní cache (selektory, importy) a skreslilo by peak
+    tracemalloc.start()
+    out = fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples: list[float] = []
+    deadline = time.perf_counter() + _MIN_SECONDS
+    while len(samples) < repeat or time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        fn(data)
+        samples.append(time.perf_counter() - t0)
+    items = len(out) if isinstance(out, list) else 1
+    return min(samples), peak, items
+
+
+def _load_baseline() -> dict:
+    if not BASELINE.exists():
+        return {}
+    return json.loads(BASELINE.read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=20, help="Počet meraní času na prípad (berie sa najlepší).")
+    ap.add_argument("--only", action="append", help="Iba prípady začínajúce týmto prefixom (dá sa opakovať).")
+    ap.add_argument("--backend", choices=available_backends(), help="Parser backend (predvolene aktívny).")
+    ap.add_argument("--threshold", type=float, default=0.5, help="Povolené zhoršenie času voči baseline (0.5 = 50 %%).")
+    ap.add_argument("--mem-threshold", type=float, default=0.1, help="Povolené zhoršenie peak pamäte (0.1 = 10 %%).")
+    ap.add_argument("--save-baseline", action="store_true", help="Zapíše meranie do bench/baseline.json.")
+    args = ap.parse_args()
+
+    backend = args.backend or get_backend()
+    baseline = _load_baseline()
+    measured: dict[str, dict] = {}
+    regressions = 0
+
+    print(f"Backend: {backend}")
+    print(f"{'prípad':<22} {'KB':>7} {'položky':>8} {'ms':>9} {'µs/pol.':>9} {'µs/KB':>8} {'peak KiB':>9}")
+    set_backend(backend)
+    try:
+        for name, (load, fn) in CASES.items():
+            if args.only and not any(name.startswith(p) for p in args.only):
+                continue
+            data = load()
+            kb = len(data.encode("utf-8")) / 1024
+            secs, peak, items = _measure(fn, data, args.repeat)
+
+            key = f"{backend}:{name}"
+            measured[key] = {"ms": round(secs * 1000, 4), "peak_kib": round(peak / 1024, 1), "kb": round(kb, 1), "items": items}
+
+            flags = []
+            ref = baseline.get(key)
+            if ref:
+                if secs * 1000 > ref["ms"] * (1 + args.threshold):
+                    flags.append(f"čas +{(secs * 1000 / ref['ms'] - 1) * 100:.0f} %")
+                if peak / 1024 > ref["peak_kib"] * (1 + args.mem_threshold):
+                    flags.append(f"pamäť +{(peak / 1024 / ref['peak_kib'] - 1) * 100:.0f} %")
+            regressions += bool(flags)
+
+            print(
+                f"{name:<22} {kb:7.1f} {items:8d} {secs * 1000:9.3f} {secs * 1e6 / items:9.2f} "
+                f"{secs * 1e6 / kb:8.2f} {peak / 1024:9.0f}" + (f"  REGRESIA ({', '.join(flags)})" if flags else "")
+            )
+    finally:
+        set_backend(None)
+
+    if args.save_baseline:
+        baseline.update(measured)
+        BASELINE.write_text(json.dumps(dict(sorted(baseline.items())), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline uložená ({len(measured)} prípadov).")
+        return 0
+
+    if not baseline:
+        print("Baseline chýba – spusti s --save-baseline.")
+    print("Bez regresií." if not regressions else f"{regressions} regresií.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""
+Ekvivalencia parser backendov (bs4 vs. lxml) nad fixtures v bench/fixtures.
+
+    python bench/check_backends.py            # porovná všetky parsery na všetkých backendoch
+    python bench/check_backends.py --update   # prepíše expected/*.json výstupom bs4 (referencia)
+    python bench/check_backends.py --repeat 50
+
+Každý parser musí na každom backende vrátiť presne to, čo je v expected/<prípad>.json.
+Návratový kód 1 = aspoň jeden rozdiel.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from parsers.article import parse_article  # noqa: E402
+from parsers.article_type1 import parse_article_type1  # noqa: E402
+from parsers.article_type2 import parse_article_type2  # noqa: E402
+from parsers.backend import BACKEND_BS4, available_backends, set_backend  # noqa: E402
+from parsers.novinky import parse_novinky_list  # noqa: E402
+from parsers.zapasy import parse_matches  # noqa: E402
+from parsers.zapasy_report_detail import parse_match_report_detail  # noqa: E402
+from parsers.zapasy_reporty import parse_match_reports  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+EXPECTED = FIXTURES / "expected"
+BASE_URL = "https://www.hckosice.sk"
+
+# prípad -> (fixture, parser)
+CASES = {
+    "novinky": ("novinky.html", lambda h: parse_novinky_list(h, BASE_URL, limit=100)),
+    "novinky_limit": ("novinky.html", lambda h: parse_novinky_list(h, BASE_URL, limit=2)),
+    "article_type1": ("article_type1.html", lambda h: parse_article_type1(h, BASE_URL)),
+    "article_type2": ("article_type2.html", lambda h: parse_article_type2(h, BASE_URL)),
+    "article_auto_type1": ("article_type1.html", lambda h: parse_article(h, BASE_URL)),
+    "article_auto_type2": ("article_type2.html", lambda h: parse_article(h, BASE_URL)),
+    "zapasy": ("zapasy.html", lambda h: parse_matches(h, BASE_URL)),
+    "zapasy_reporty": ("zapasy.html", lambda h: parse_match_reports(h, BASE_URL)),
+    "report_detail": ("report_detail.html", lambda h: parse_match_report_detail(h, BASE_URL)),
+}
+
+
+def _run(backend: str, name: str, html: str):
+    set_backend(backend)
+    try:
+        # JSON round-trip – porovnávame to isté, čo je uložené v expected/
+        return json.loads(json.dumps(CASES[name][1](html), ensure_ascii=False))
+    finally:
+        set_backend(None)
+
+
+def _first_diff(a, b, path: str = "") -> str:
+    if type(a) is not type(b):
+        return f"{path or '<root>'}: {a!r} != {b!r}"
+    if isinstance(a, dict):
+        for k in sorted(set(a) | set(b)):
+            if a.get(k) != b.get(k):
+                return _first_diff(a.get(k), b.get(k), f"{path}.{k}")
+    elif isinstance(a, list):
+        if len(a) != len(b):
+            return f"{path or '<root>'}: dĺžka {len(a)} != {len(b)}"
+        for i, (x, y) in enumerate(zip(a, b)):
+            if x != y:
+                return _first_diff(x, y, f"{path}[{i}]")
+    return f"{path or '<root>'}: {a!r} != {b!r}"
+
+
+def _measure(backend: str, name: str, html: str, repeat: int) -> tuple[float, int]:
+    set_backend(backend)
+    try:
+        fn = CASES[name][1]
+        tracemalloc.start()
+        fn(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            fn(html)
+        return (time.perf_counter() - t0) / repeat, peak
+    finally:
+        set_backend(None)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--update", action="store_true", help="Prepíše expected/*.json výstupom bs4.")
+    ap.add_argument("--repeat", type=int, default=20, help="Počet opakovaní pri meraní času.")
+    args = ap.parse_args()
+
+    backends = available_backends()
+    EXPECTED.mkdir(parents=True, exist_ok=True)
+    failures = 0
+
+    print(f"Backendy: {', '.join(backends)}")
+    for name, (fixture, _) in CASES.items():
+        html = (FIXTURES / fixture).read_text(encoding="utf-8")
+        expected_path = EXPECTED / f"{name}.json"
+
+        if args.update:
+            data = _run(BACKEND_BS4, name, html)
+            expected_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+        expected = json.loads(expected_path.read_text(encoding="utf-8"))
+        timings = []
+        for backend in backends:
+            got = _run(backend, name, html)
+            if got != expected:
+                failures += 1
+                print(f"FAIL {name} [{backend}] {_first_diff(expected, got)}")
+            secs, peak = _measure(backend, name, html, args.repeat)
+            timings.append(f"{backend} {secs * 1000:.2f} ms / {peak / 1024:.0f} KiB")
+        print(f"ok   {name:<20} " + " | ".join(timings) if not failures else f"     {name:<20} " + " | ".join(timings))
+
+    print("Všetko zhodné." if not failures else f"{failures} rozdielov.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,14 +11,21 @@ class Config:
     ZAPASY_URL: str = "https://www.hckosice.sk/a-muzstvo/zapasy"  # page
     ROBOTS_URL: str = "https://www.hckosice.sk/robots.txt"
 
-    # API (zápasy sa načítavajú cez XHR)
-    ZAPASY_API_URL: str = "https://www.hckosice.sk/api/matches?league=extraliga&season=2025-2026"
+    # API (zápasy sa načítavajú cez XHR) – ?league=…&season=…
+    ZAPASY_API_BASE: str = "https://www.hckosice.sk/api/matches"
+    CURRENT_SEASON: str = "2025-2026"
+    # bežný beh: MATCH_LEAGUES × CURRENT_SEASON (prázdne) alebo explicitné "liga:sezóna",
+    # --backfill: MATCH_LEAGUES × posledných N sezón
+    MATCH_FEEDS: tuple = ()
+    MATCH_LEAGUES: tuple = ("extraliga",)
+    MATCH_BACKFILL_SEASONS: int = 10
 
-    # Low footprint
-    MIN_SLEEP: float = 2.0
-    MAX_SLEEP: float = 6.0
-    DETAIL_EXTRA_SLEEP_MIN: float = 3.0
-    DETAIL_EXTRA_SLEEP_MAX: float = 8.0
+    # Low footprint – token bucket na host (1 request / 8 s ako pôvodný sleep pred detailom, bez dávok)
+    # + max. súbežných requestov
+    # robots.txt Crawl-delay / Request-rate môže rate ešte znížiť, nikdy nie zvýšiť
+    HOST_RPS: float = 0.125
+    HOST_BURST: float = 1.0
+    FETCH_CONCURRENCY: int = 3
 
     TIMEOUT: float = 20.0
     MAX_RETRIES: int = 4
@@ -27,9 +34,32 @@ class Config:
     BACKOFF_JITTER_MAX: float = 1.0
 
     # Incremental limits
-    NOVINKY_LIMIT: int = 30
+    NOVINKY_LIMIT: int = 30  # max. nových kariet za bežný beh
+    NOVINKY_KNOWN_STREAK: int = 3  # stop po N už známych článkoch za sebou
+    NOVINKY_MAX_PAGES: int = 10
+    NOVINKY_BACKFILL_MAX_PAGES: int = 500
     MAX_REQUESTS_PER_RUN: int = 120
 
+    # Parsovanie detailov v procesoch (0 = v hlavnom procese), max. rozpracovaných tiel na proces
+    PARSE_WORKERS: int = 0
+    PARSE_QUEUE_PER_WORKER: int = 4
+
+    # Write-behind zápis do DB: checkpoint (1 transakcia) každých N riadkov alebo T sekúnd
+    DB_FLUSH_ROWS: int = 50
+    DB_FLUSH_SECONDS: float = 30.0
+
+    # Reporty zápasov: odohrané za posledné N dní sa znova overia (conditional GET)
+    REPORT_RECHECK_DAYS: int = 3
+
+    # Daemon – intervaly v sekundách: (štart, min, max, strop počas zápasového okna)
+    DAEMON_NOVINKY: tuple = (1800.0, 300.0, 6 * 3600.0, 600.0)
+    DAEMON_MATCHES: tuple = (3600.0, 300.0, 12 * 3600.0, 300.0)
+    DAEMON_ARTICLE: tuple = (6 * 3600.0, 3600.0, 7 * 86400.0, None)
+    DAEMON_ARTICLE_RECRAWL_DAYS: int = 7  # re-crawl iba článkov z posledných N dní
+    DAEMON_SYNC_INTERVAL: float = 3600.0  # zoznam článkov + robots.txt
+    DAEMON_GAME_BEFORE_S: float = 2 * 3600.0
+    DAEMON_GAME_AFTER_S: float = 4 * 3600.0
+
     # Identification (uprav si kontakt)
     USER_AGENT: str = "HCKosiceLowFootprintScraper/1.0 (kontakt: example@email.com)"
 
@@ -38,5 +68,16 @@ class Config:
     DATA_DIR: Path = PROJECT_ROOT / "data"
     LOG_DIR: Path = PROJECT_ROOT / "logs"
 
+    # Lokálna cache surových odpovedí (gzip, content-addressed, LRU podľa veľkosti)
+    HTTP_CACHE_DIR: Path = DATA_DIR / "http_cache"
+    HTTP_CACHE_MAX_BYTES: int = 200_000_000
+
+    # backfill /novinky: strana, na ktorej pokračuje ďalší beh
+    NOVINKY_BACKFILL_STATE_PATH: Path = DATA_DIR / "novinky_backfill.json"
+
+    # robots.txt cache (text + robots_cache.json s časom stiahnutia a ETag/Last-Modified)
+    ROBOTS_CACHE_PATH: Path = DATA_DIR / "robots_cache.txt"
+    ROBOTS_CACHE_TTL: float = 24 * 3600.0
+
     # (už nepoužívaš pri Storage() na Postgres, ale nechávam ako fallback)
     DB_PATH: Path = DATA_DIR / "hckosice.sqlite3"
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from parsers.backend import Selector, parse_html
+from parsers.article_type1 import parse_article_type1_tree
+from parsers.article_type2 import parse_article_type2_tree
+
+_TYPE1 = Selector("div.match-banner")
+_TYPE2 = (Selector("div.article-news__header-image"), Selector('div[property="schema:text"]'))
+
+
+def detect_article_type_tree(soup) -> str:
+    if soup.select_one(_TYPE1):
+        return "type1"
+    if any(soup.select_one(sel) for sel in _TYPE2):
+        return "type2"
+    return "type2"
+
+
+def parse_article(html: str, base_url: str) -> dict:
+    """
+    Detail článku jedným parsovaním: detekcia typu, polia aj text idú z toho istého stromu.
+    """
+    soup = parse_html(html)
+    if detect_article_type_tree(soup) == "type1":
+        return parse_article_type1_tree(soup, base_url)
+    return parse_article_type2_tree(soup, base_url)
@@ -1,33 +1,41 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+from parsers.backend import parse_html
+from parsers.schema import Schema, field, node, text
 
 from utils.dates import normalize_added_date
-from utils.html import extract_img_url_from_node, inner_html, clean_text_from_html
+from utils.html import absolutize, img_src_from_node, inner_html, text_from_node
+
+PAGE = Schema(
+    {
+        "title": field(".article-news h1", "h1", post=text()),
+        "date_text": field(".article-news__info", post=text(" ")),
+        "header_src": field("div.article-news__header-image", post=img_src_from_node),
+        "body": field('div[property="schema:text"]', ".article-news main div[property]", post=node),
+    }
+)
 
 def parse_article_type2(html: str, base_url: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
+    return parse_article_type2_tree(parse_html(html), base_url)
 
-    title_el = soup.select_one(".article-news h1") or soup.select_one("h1")
-    title = title_el.get_text(strip=True) if title_el else None
+def parse_article_type2_tree(soup, base_url: str) -> dict:
+    """
+    Ako parse_article_type2, ale nad už sparsovaným dokumentom (parsers.article).
+    """
+    page = PAGE.extract(soup)
 
-    info_el = soup.select_one(".article-news__info")
-    date_text = info_el.get_text(" ", strip=True) if info_el else None
+    date_text = page["date_text"]
     date_iso = normalize_added_date(date_text or "") if date_text else None
 
-    header = soup.select_one("div.article-news__header-image")
-    header_image_url = extract_img_url_from_node(base_url, header)
-
-    body = soup.select_one('div[property="schema:text"]') or soup.select_one(".article-news main div[property]")
-    content_html = inner_html(body)
-    content_text = clean_text_from_html(content_html)
+    header_src = page["header_src"]
+    body = page["body"]
 
     return {
         "type": "type2",
-        "title": title,
+        "title": page["title"],
         "date_text": date_text,
         "date_iso": date_iso,
-        "header_image_url": header_image_url,
+        "header_image_url": absolutize(base_url, header_src) if header_src is not None else None,
         "match_datetime_text": None,
         "match_datetime_iso": None,
         "match_round": None,
@@ -35,6 +43,6 @@ def parse_article_type2(html: str, base_url: str) -> dict:
         "match_is_win": None,
         "match_logo_home_url": None,
         "match_logo_away_url": None,
-        "content_html": content_html,
-        "content_text": content_text,
+        "content_html": inner_html(body),
+        "content_text": text_from_node(body),
     }
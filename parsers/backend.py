@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Iterator
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:  # rýchly backend: čisté lxml.html + CSS selektory skompilované do XPath
+    import lxml.html
+    from cssselect import HTMLTranslator
+    from lxml import etree
+except ImportError:  # pragma: no cover - bez cssselect ostáva iba bs4
+    HTMLTranslator = None
+
+BACKEND_ENV = "HC_PARSER_BACKEND"
+BACKEND_BS4 = "bs4"
+BACKEND_LXML = "lxml"
+
+# reťazce, ktoré bs4 get_text() vynecháva (Script, Stylesheet, TemplateString, Ruby*)
+_NO_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+# text v týchto tagoch bs4 ("minimal" formatter) neescapuje
+_CDATA_TAGS = frozenset({"script", "style"})
+# void elementy – bs4 ich bez obsahu serializuje ako <br/>
+_VOID_TAGS = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+        "menuitem", "meta", "param", "source", "track", "wbr",
+        "basefont", "bgsound", "command", "frame", "image", "isindex", "nextid", "spacer",
+    }
+)
+# viachodnotové atribúty – bs4 ich rozdelí podľa whitespace a pri výstupe spojí medzerou
+_LIST_ATTRS = {
+    "*": frozenset({"class", "accesskey", "dropzone"}),
+    "a": frozenset({"rel", "rev"}),
+    "link": frozenset({"rel", "rev"}),
+    "td": frozenset({"headers"}),
+    "th": frozenset({"headers"}),
+    "form": frozenset({"accept-charset"}),
+    "object": frozenset({"archive"}),
+    "area": frozenset({"rel"}),
+    "icon": frozenset({"sizes"}),
+    "iframe": frozenset({"sandbox"}),
+    "output": frozenset({"for"}),
+}
+# bs4 zlučuje reťazce iba z ASCII whitespace na " " / "\n" – okrem <pre> a <textarea>
+_ASCII_SPACES = " \n\t\f\r"
+_PRESERVE_WS_TAGS = frozenset({"pre", "textarea"})
+# odstránený uzol (decompose) ostáva v strome ako prázdna značka, aby sa nezlepil okolitý text
+_REMOVED = "hc-removed"
+
+# inkrementálne parsovanie zoznamov: veľkosť kúskov HTML pre HTMLPullParser
+_PULL_CHUNK = 16 * 1024
+_TAG_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9]*")
+
+_backend: str | None = None
+
+
+def available_backends() -> list[str]:
+    return [BACKEND_LXML, BACKEND_BS4] if HTMLTranslator is not None else [BACKEND_BS4]
+
+
+def get_backend() -> str:
+    """
+    Aktívny backend: set_backend() > env HC_PARSER_BACKEND > lxml (ak je cssselect) > bs4.
+    """
+    if _backend is not None:
+        return _backend
+    name = os.environ.get(BACKEND_ENV, "").strip().lower()
+    if name in available_backends():
+        return name
+    return available_backends()[0]
+
+
+def set_backend(name: str | None) -> None:
+    if name is not None and name not in available_backends():
+        raise ValueError(f"Parser backend '{name}' nie je dostupný (k dispozícii: {', '.join(available_backends())})")
+    global _backend
+    _backend = name
+
+
+def parse_html(html: str, backend: str | None = None, only: tuple[str | Callable | None, dict] | None = None):
+    """
+    HTML -> koreňový uzol dokumentu s rozhraním, ktoré parsery používajú
+    (select_one, select, find, get, classes, get_text, inner_html, outer_html, decompose).
+    Oba backendy vracajú pre parsery rovnaké hodnoty (bench/check_backends.py).
+    Známy rozdiel: bezhodnotové boolean atribúty formulárov (<input disabled>) libxml2
+    v strome vyplní menom atribútu (disabled="disabled"), bs4 dostane "".
+
+    - only: (tag, attrs) pre bs4 SoupStrainer – Python objekty vzniknú iba pre zodpovedajúce
+      podstromy (zvyšok stránky sa zahodí). Tag môže byť aj funkcia (name, attrs) -> bool. lxml ho ignoruje: strom stavia libxml2 v C
+      a uzly sa obaľujú až pri selecte, takže celý dokument je tam lacný.
+    """
+    if (backend or get_backend()) == BACKEND_LXML:
+        return LxmlNode(_lxml_document(html or ""))
+    if only is not None:
+        return BsNode(BeautifulSoup(html or "", "lxml", parse_only=SoupStrainer(only[0], only[1])))
+    return BsNode(BeautifulSoup(html or "", "lxml"))
+
+
+def iter_list_items(
+    html: str,
+    item: str,
+    *,
+    parent: str | None = None,
+    strainer: tuple[str | None, dict] | None = None,
+    backend: str | None = None,
+) -> Iterator:
+    """
+    Položky zoznamu (`parent > item`, resp. iba `item`) v poradí dokumentu.
+    `item` a `parent` sú jednoduché selektory bez kombinátorov (napr. "li.article").
+
+    - lxml: HTMLPullParser – HTML sa parsuje po kúskoch a položka sa vydá hneď, ako je
+      uzavretá; keď volajúci prestane čítať (limit), zvyšok stránky sa už neparsuje
+    - bs4: SoupStrainer `strainer` – postaví sa iba podstrom kontajnera
+    """
+    if (backend or get_backend()) == BACKEND_LXML:
+        m = _TAG_RE.match(item)
+        if m:
+            yield from _iter_lxml_pull(html or "", m.group(0).lower(), item, parent)
+            return
+        doc = LxmlNode(_lxml_document(html or ""))
+    else:
+        doc = parse_html(html, BACKEND_BS4, only=strainer)
+    yield from doc.select(f"{parent} > {item}" if parent else item)
+
+
+class Selector:
+    """
+    CSS selektor skompilovaný raz – pre bs4 (soupsieve) aj lxml (XPath).
+    Uzly ho prijímajú všade, kde inak berú reťazec (select_one, select).
+    """
+
+    __slots__ = ("css", "bs", "xpath")
+
+    def __init__(self, css: str) -> None:
+        self.css = css
+        self.bs = soupsieve.compile(css)
+        self.xpath = _xpath(css) if HTMLTranslator is not None else None
+
+    def __repr__(self) -> str:
+        return f"Selector({self.css!r})"
+
+
+# --- bs4 ---
+class BsNode:
+    __slots__ = ("_tag",)
+
+    def __init__(self, tag) -> None:
+        self._tag = tag
+
+    @property
+    def name(self) -> str:
+        return self._tag.name
+
+    def select_one(self, css: str | Selector) -> BsNode | None:
+        el = css.bs.select_one(self._tag) if type(css) is Selector else self._tag.select_one(css)
+        return BsNode(el) if el is not None else None
+
+    def select(self, css: str | Selector) -> list[BsNode]:
+        found = css.bs.select(self._tag) if type(css) is Selector else self._tag.select(css)
+        return [BsNode(el) for el in found]
+
+    def find(self, name: str) -> BsNode | None:
+        el = self._tag.find(name)
+        return BsNode(el) if el is not None else None
+
+    def get(self, attr: str, default=None):
+        v = self._tag.get(attr, default)
+        return " ".join(v) if isinstance(v, list) else v
+
+    @property
+    def classes(self) -> list[str]:
+        return list(self._tag.get("class") or [])
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._tag.get_text(separator, strip=strip)
+
+    def inner_html(self) -> str:
+        return "".join(str(x) for x in self._tag.contents)
+
+    def outer_html(self) -> str:
+        return str(self._tag)
+
+    def decompose(self) -> None:
+        self._tag.decompose()
+
+
+# --- lxml ---
+def _lxml_document(html: str):
+    parser = lxml.html.HTMLParser()
+    try:
+        root = lxml.html.document_fromstring(html, parser=parser)
+    except ValueError:
+        # str s XML deklaráciou kódovania lxml odmietne – parsujeme bajty
+        root = lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except etree.ParserError:
+        # prázdny dokument
+        root = lxml.html.document_fromstring("<html></html>", parser=parser)
+    return root.getroottree()
+
+
+@lru_cache(maxsize=512)
+def _xpath(css: str):
+    # descendant:: – ako bs4 select(): hľadá iba v potomkoch, nie v samotnom uzle
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix="descendant::"))
+
+
+@lru_cache(maxsize=128)
+def _self_xpath(css: str):
+    # test "zodpovedá uzol selektoru?" pre jednoduchý selektor
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix="self::"))
+
+
+def _iter_lxml_pull(html: str, tag: str, item: str, parent: str | None) -> Iterator[LxmlNode]:
+    is_item = _self_xpath(item)
+    is_parent = _self_xpath(parent) if parent else None
+    pull = etree.HTMLPullParser(events=("end",), tag=tag)
+
+    def matching():
+        for _, el in pull.read_events():
+            if not is_item(el):
+                continue
+            if is_parent is not None:
+                p = el.getparent()
+                if p is None or not is_parent(p):
+                    continue
+            yield LxmlNode(el)
+
+    for i in range(0, len(html), _PULL_CHUNK):
+        pull.feed(html[i : i + _PULL_CHUNK])
+        yield from matching()
+    try:
+        pull.close()
+    except etree.XMLSyntaxError:
+        return  # prázdny dokument
+    yield from matching()
+
+
+def _ws(s: str, preserve: bool) -> str:
+    if preserve or s.strip(_ASCII_SPACES):
+        return s
+    return "\n" if "\n" in s else " "
+
+
+def _preserves_ws(el) -> bool:
+    return any(a.tag in _PRESERVE_WS_TAGS for a in el.iterancestors()) or el.tag in _PRESERVE_WS_TAGS
+
+
+def _escape(s: str) -> str:
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _attr_value(v: str) -> str:
+    v = _escape(v)
+    if '"' in v:
+        if "'" in v:
+            return '"' + v.replace('"', "&quot;") + '"'
+        return "'" + v + "'"
+    return '"' + v + '"'
+
+
+def _is_list_attr(tag: str, attr: str) -> bool:
+    return attr in _LIST_ATTRS["*"] or attr in _LIST_ATTRS.get(tag, ())
+
+
+def _serialize(el, out: list[str], preserve: bool = False) -> None:
+    tag = el.tag
+    if not isinstance(tag, str):
+        if tag is etree.Comment:
+            out.append(f"<!--{el.text or ''}-->")
+        elif tag is etree.ProcessingInstruction:
+            out.append(f"<?{el.target} {el.text or ''}>" if el.text else f"<?{el.target}>")
+        return
+    if tag == _REMOVED:
+        return
+
+    attrs = []
+    for k, v in sorted(el.attrib.items()):
+        if _is_list_attr(tag, k):
+            v = " ".join(v.split())
+        attrs.append(f" {k}={_attr_value(v)}")
+    open_tag = f"<{tag}{''.join(attrs)}"
+
+    if tag in _VOID_TAGS and not el.text and len(el) == 0:
+        out.append(open_tag + "/>")
+        return
+
+    out.append(open_tag + ">")
+    raw = tag in _CDATA_TAGS
+    preserve = preserve or tag in _PRESERVE_WS_TAGS
+    if el.text:
+        text = _ws(el.text, preserve)
+        out.append(text if raw else _escape(text))
+    for ch in el:
+        _serialize(ch, out, preserve)
+        if ch.tail:
+            tail = _ws(ch.tail, preserve)
+            out.append(tail if raw else _escape(tail))
+    out.append(f"</{tag}>")
+
+
+def _strings(el, out: list[str], preserve: bool = False) -> None:
+    preserve = preserve or el.tag in _PRESERVE_WS_TAGS
+    if el.text:
+        out.append(_ws(el.text, preserve))
+    for ch in el:
+        if isinstance(ch.tag, str) and ch.tag not in _NO_TEXT_TAGS and ch.tag != _REMOVED:
+            _strings(ch, out, preserve)
+        if ch.tail:
+            out.append(_ws(ch.tail, preserve))
+
+
+class LxmlNode:
+    __slots__ = ("_el",)
+
+    def __init__(self, el) -> None:
+        # _el je lxml element, pre celý dokument ElementTree (select pokryje aj <html>)
+        self._el = el
+
+    @property
+    def _element(self):
+        el = self._el
+        return el.getroot() if isinstance(el, etree._ElementTree) else el
+
+    @property
+    def name(self) -> str:
+        return self._element.tag
+
+    def select_one(self, css: str | Selector) -> LxmlNode | None:
+        found = (css.xpath if type(css) is Selector else _xpath(css))(self._el)
+        return LxmlNode(found[0]) if found else None
+
+    def select(self, css: str | Selector) -> list[LxmlNode]:
+        return [LxmlNode(el) for el in (css.xpath if type(css) is Selector else _xpath(css))(self._el)]
+
+    def find(self, name: str) -> LxmlNode | None:
+        el = next(self._element.iterdescendants(name), None)
+        return LxmlNode(el) if el is not None else None
+
+    def get(self, attr: str, default=None):
+        v = self._element.get(attr)
+        if v is None:
+            return default
+        return " ".join(v.split()) if _is_list_attr(self._element.tag, attr) else v
+
+    @property
+    def classes(self) -> list[str]:
+        return (self._element.get("class") or "").split()
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        el = self._element
+        parts: list[str] = []
+        _strings(el, parts, _preserves_ws(el))
+        if strip:
+            parts = [p.strip() for p in parts]
+            parts = [p for p in parts if p]
+        return separator.join(parts)
+
+    def inner_html(self) -> str:
+        # rovnako ako "".join(str(x) for x in tag.contents) v bs4: priame textové
+        # deti (aj komentáre) idú von bez escapovania, vnorené tagy cez serializer
+        el = self._element
+        preserve = _preserves_ws(el)
+        out: list[str] = []
+        if el.text:
+            out.append(_ws(el.text, preserve))
+        for ch in el:
+            if ch.tag is etree.Comment:
+                out.append(ch.text or "")
+            else:
+                _serialize(ch, out, preserve)
+            if ch.tail:
+                out.append(_ws(ch.tail, preserve))
+        return "".join(out)
+
+    def outer_html(self) -> str:
+        el = self._element
+        out: list[str] = []
+        _serialize(el, out, any(a.tag in _PRESERVE_WS_TAGS for a in el.iterancestors()))
+        return "".join(out)
+
+    def decompose(self) -> None:
+        el = self._element
+        el.clear(keep_tail=True)
+        el.tag = _REMOVED
@@ -1,36 +1,43 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+from parsers.backend import iter_list_items
+from parsers.schema import Schema, attr, field, text
 
 from utils.dates import parse_datetime_safe
-from utils.html import absolutize, extract_img_url_from_node
+from utils.html import absolutize, img_src_from_node
 
-def parse_novinky_list(html: str, base_url: str, limit: int) -> list[dict]:
-    soup = BeautifulSoup(html, "lxml")
+CARD = Schema(
+    {
+        "href": field("a[href]", post=attr("href")),
+        "title": field(".article__title", post=text()),
+        "date_text": field(".article__date", post=text()),
+        "image_src": field(".article__image-wrapper", post=img_src_from_node),
+    }
+)
 
+def parse_novinky_list(html: str, base_url: str, limit: int) -> list[dict]:
+    # parsuje sa iba zoznam článkov; po `limit` kartách sa zvyšok stránky už neparsuje
     items = []
-    for li in soup.select("ul.articles-list > li.article"):
-        a = li.select_one("a[href]")
-        if not a:
+    lis = iter_list_items(
+        html,
+        "li.article",
+        parent="ul.articles-list",
+        strainer=("ul", {"class": "articles-list"}),
+    )
+    for li in lis:
+        card = CARD.extract(li)
+        if card["href"] is None:
             continue
 
-        url = absolutize(base_url, a.get("href", "").strip())
-
-        title_el = li.select_one(".article__title")
-        date_el = li.select_one(".article__date")
-        img_wrap = li.select_one(".article__image-wrapper")
-
-        title = title_el.get_text(strip=True) if title_el else None
-        date_text = date_el.get_text(strip=True) if date_el else None
-        date_iso = parse_datetime_safe(date_text or "") if date_text else None
-        card_image_url = extract_img_url_from_node(base_url, img_wrap)
+        date_text = card["date_text"]
+        src = card["image_src"]
 
         items.append({
-            "url": url,
-            "title": title,
+            "url": absolutize(base_url, card["href"].strip()),
+            "title": card["title"],
             "date_text": date_text,
-            "date_iso": date_iso,
-            "card_image_url": card_image_url,
+            "date_iso": parse_datetime_safe(date_text or "") if date_text else None,
+            "card_image_url": absolutize(base_url, src) if src is not None else None,
         })
 
         if len(items) >= limit:
@@ -0,0 +1,91 @@
+"""
+Deklaratívna extrakcia polí: pole -> selektory v poradí (vyhráva prvý nájdený) -> post-procesor.
+
+Selektory sa kompilujú raz pri importe (Selector = soupsieve + XPath), takže slučky
+cez položky zoznamov už nič nekompilujú. Nový typ stránky = nová Schema + pár riadkov,
+ktoré zo surových polí poskladajú výsledný dict.
+
+Post-procesor dostane nájdený uzol alebo None (nič nezodpovedá / chýba scope)
+a vráti hodnotu poľa. Pri many=True sa volá pre každý nájdený uzol zvlášť.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from parsers.backend import Selector
+
+Post = Callable[[Any], Any]
+
+
+def text(separator: str = "", strip: bool = True) -> Post:
+    def post(node):
+        return node.get_text(separator, strip=strip) if node is not None else None
+
+    return post
+
+
+def attr(name: str) -> Post:
+    def post(node):
+        return node.get(name) if node is not None else None
+
+    return post
+
+
+def node(n):
+    return n
+
+
+def class_flag(suffix: str) -> Post:
+    """1, ak má uzol triedu končiacu na `suffix` (napr. "__score--win"), inak 0."""
+
+    def post(node):
+        classes = node.classes if node is not None else []
+        return 1 if any(c.endswith(suffix) for c in classes) else 0
+
+    return post
+
+
+@dataclass(frozen=True)
+class Field:
+    selectors: tuple[Selector, ...]
+    post: Post
+    many: bool = False
+
+    def extract(self, root):
+        if self.many:
+            if root is not None:
+                for sel in self.selectors:
+                    found = root.select(sel)
+                    if found:
+                        return [self.post(n) for n in found]
+            return []
+
+        found = None
+        if root is not None:
+            for sel in self.selectors:
+                found = root.select_one(sel)
+                if found is not None:
+                    break
+        return self.post(found)
+
+
+def field(*css: str, post: Post = text(), many: bool = False) -> Field:
+    return Field(tuple(Selector(c) for c in css), post, many)
+
+
+class Schema:
+    """
+    Sada polí extrahovaných z jedného uzla. `scope` (voliteľný selektor) najprv
+    zúži koreň na prvý zodpovedajúci podstrom – keď chýba, polia dostanú None.
+    """
+
+    def __init__(self, fields: dict[str, Field], scope: str | None = None) -> None:
+        self.fields = fields
+        self.scope = Selector(scope) if scope else None
+
+    def extract(self, root) -> dict[str, Any]:
+        if self.scope is not None and root is not None:
+            root = root.select_one(self.scope)
+        return {name: f.extract(root) for name, f in self.fields.items()}
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from bs4 import BeautifulSoup
+
+from parsers.backend import Selector, parse_html
+from parsers.schema import Schema, class_flag, field, node, text
 
 from utils.dates import parse_datetime_safe
 
@@ -21,9 +23,9 @@ def _abs_url(base_url: str, src: str) -> str:
     return base_url.rstrip("/") + "/" + src
 
 
-def _extract_logo_url(base_url: str, node) -> str | None:
+def _logo_src(node) -> str | None:
     """
-    Vytiahne URL loga z:
+    Vytiahne URL loga (bez absolutizácie) z:
     - <img src="...">
     - inline style background-image: url(...)
     """
@@ -32,34 +34,46 @@ def _extract_logo_url(base_url: str, node) -> str | None:
 
     img = node.find("img")
     if img and img.get("src"):
-        return _abs_url(base_url, img["src"])
+        return img.get("src")
 
     style = node.get("style") or ""
     m = _BG_RE.search(style)
     if m:
-        return _abs_url(base_url, m.group(2))
+        return m.group(2)
 
     return None
 
 
-def _find_logo_node(item, side: str):
+def _logo_field(side: str):
     """
     Robustne nájde logo node pre home/away bez spoliehania sa na presnú DOM štruktúru.
     Na webe sa vyskytujú varianty:
       - <div class="matches-list__team-logo matches-list__team-logo--home">...</div>
       - <div class="matches-list__team matches-list__team-logo--away">...</div>
     """
-    # 1) priamo element s triedou --home/--away
-    node = item.select_one(f".matches-list__team-logo--{side}")
-    if node:
-        return node
-
-    # 2) niekedy je --home/--away až na vnorenom elemente v .matches-list__team
-    node = item.select_one(f".matches-list__team .matches-list__team-logo--{side}")
-    if node:
-        return node
-
-    return None
+    return field(
+        f".matches-list__team-logo--{side}",  # 1) priamo element s triedou --home/--away
+        f".matches-list__team .matches-list__team-logo--{side}",  # 2) vnorený v .matches-list__team
+        post=_logo_src,
+    )
+
+
+ITEMS = Selector(".matches-list__item")
+
+ITEM = Schema(
+    {
+        "time": field("time.matches-list__date", post=node),
+        "round": field(".matches-list__round", post=text(" ")),
+        "venue": field(".matches-list__button.matches-list__button--primary", ".matches-list__button", post=text(" ")),
+        "teams": field(".matches-list__team-names > .matches-list__team-name", post=text(" "), many=True),
+        "logo_home_src": _logo_field("home"),
+        "logo_away_src": _logo_field("away"),
+        "score": field(".matches-list__score", post=text(" ")),
+        # na webe je často matches-list__score--win
+        "score_win": field(".matches-list__score", post=class_flag("__score--win")),
+        "score_periods": field(".matches-list__score-periods", post=text(" ")),
+    }
+)
 
 
 def _is_real_score(text: str | None) -> bool:
@@ -77,12 +91,15 @@ def _is_real_score(text: str | None) -> bool:
 
 
 def parse_matches(html: str, base_url: str) -> list[dict]:
-    soup = BeautifulSoup(html, "lxml")
+    # stačia položky zoznamu zápasov (bs4 ostatok stránky vôbec nestavia)
+    soup = parse_html(html, only=(None, {"class": "matches-list__item"}))
     results: list[dict] = []
 
-    for item in soup.select(".matches-list__item"):
+    for item in soup.select(ITEMS):
+        raw = ITEM.extract(item)
+
         # --- dátum ---
-        time_el = item.select_one("time.matches-list__date")
+        time_el = raw["time"]
         date_text = time_el.get_text(" ", strip=True) if time_el else None
 
         if time_el and time_el.get("datetime"):
@@ -92,48 +109,27 @@ def parse_matches(html: str, base_url: str) -> list[dict]:
             parsed = parse_datetime_safe(date_text or "")
             date_iso = (parsed or "").strip() or None
 
-        # --- kolo ---
-        round_el = item.select_one(".matches-list__round")
-        round_text = round_el.get_text(" ", strip=True) if round_el else None
-
-        # --- doma/vonku ---
-        venue_el = (
-            item.select_one(".matches-list__button.matches-list__button--primary")
-            or item.select_one(".matches-list__button")
-        )
-        venue = venue_el.get_text(" ", strip=True) if venue_el else None
+        round_text = raw["round"]
+        venue = raw["venue"]
 
         # --- názvy tímov ---
-        team_names = [
-            x.get_text(" ", strip=True)
-            for x in item.select(".matches-list__team-names > .matches-list__team-name")
-        ]
+        team_names = raw["teams"]
         team_home = team_names[0] if len(team_names) > 0 else None
         team_away = team_names[1] if len(team_names) > 1 else None
 
         # --- logá ---
-        logo_home_node = _find_logo_node(item, "home")
-        logo_away_node = _find_logo_node(item, "away")
-
-        logo_home_url = _extract_logo_url(base_url, logo_home_node)
-        logo_away_url = _extract_logo_url(base_url, logo_away_node)
+        logo_home_url = _abs_url(base_url, raw["logo_home_src"]) if raw["logo_home_src"] is not None else None
+        logo_away_url = _abs_url(base_url, raw["logo_away_src"]) if raw["logo_away_src"] is not None else None
 
         # --- skóre + win/lose ---
-        score_el = item.select_one(".matches-list__score")
-        raw_score_text = score_el.get_text(" ", strip=True) if score_el else None
-
-        periods_el = item.select_one(".matches-list__score-periods")
-        score_periods = periods_el.get_text(" ", strip=True) if periods_el else None
+        raw_score_text = raw["score"]
+        score_periods = raw["score_periods"]
 
         # status: played/upcoming
         # upcoming môže mať score element, ale text býva "VS"
         status = "played" if _is_real_score(raw_score_text) or score_periods else "upcoming"
 
-        is_win = None
-        if score_el and status == "played":
-            classes = score_el.get("class", []) or []
-            # na webe je často matches-list__score--win
-            is_win = 1 if any(c.endswith("__score--win") or c == "matches-list__score--win" for c in classes) else 0
+        is_win = raw["score_win"] if raw_score_text is not None and status == "played" else None
 
         # score uložíme len ak je reálne "X:Y"
         score = raw_score_text if (status == "played" and _is_real_score(raw_score_text)) else None
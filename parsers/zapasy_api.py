@@ -2,17 +2,31 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
+from typing import Iterator
+
+try:  # voliteľné: rýchlejší JSON parser v C
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 _DIGIT_SCORE_RE = re.compile(r"\d+\s*:\s*\d+")
 _TZ_FIX_RE = re.compile(r"([+-]\d{2}):(\d{2})$")  # +01:00 -> +0100
 
+_INT_BOOLS = {"0": 0, "1": 1, 0: 0, 1: 1, False: 0, True: 1}
+
+
+@lru_cache(maxsize=4096)
+def _norm_text(s: str) -> str | None:
+    # tímy, logá, kolá aj formáty dátumu sa v payloade opakujú – normalizujú sa raz
+    s = " ".join(s.replace("\xa0", " ").split())
+    return s or None
+
 
 def _norm_str(x) -> str | None:
     if x is None:
         return None
-    s = str(x).replace("\xa0", " ").strip()
-    s = " ".join(s.split())
-    return s or None
+    return _norm_text(x if type(x) is str else str(x))
 
 
 def _norm_tz(date_iso: str | None) -> str | None:
@@ -24,13 +38,18 @@ def _norm_tz(date_iso: str | None) -> str | None:
     if not date_iso:
         return None
     s = date_iso.strip()
-    s = _TZ_FIX_RE.sub(r"\1\2", s)
+    if len(s) > 6 and s[-3] == ":" and s[-6] in "+-":
+        s = _TZ_FIX_RE.sub(r"\1\2", s)
     return s
 
 
 def _to_int_bool(v) -> int | None:
     if v is None:
         return None
+    if type(v) in (str, int, bool):
+        hit = _INT_BOOLS.get(v.strip() if type(v) is str else v)
+        if hit is not None:
+            return hit
     # API používa "0"/"1" ako string
     if isinstance(v, str) and v.strip() in ("0", "1"):
         return 1 if v.strip() == "1" else 0
@@ -56,12 +75,27 @@ def _is_real_score(text: str | None) -> bool:
     return bool(_DIGIT_SCORE_RE.search(t))
 
 
+def _loads(payload: str | bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # napr. NaN alebo obrie čísla – stdlib je benevolentnejší
+    return json.loads(payload)
+
+
 def parse_matches_api_json(json_text: str) -> list[dict]:
-    items = json.loads(json_text)
-    if not isinstance(items, list):
-        return []
+    return list(iter_matches_api_json(json_text))
 
-    results: list[dict] = []
+
+def iter_matches_api_json(payload: str | bytes) -> Iterator[dict]:
+    """
+    Normalizované zápasy z API ako generátor. Payload sa dekóduje naraz (orjson, ak je
+    nainštalovaný) – jeden feed je liga × sezóna, teda najviac pár stoviek zápasov.
+    """
+    items = _loads(payload)
+    if not isinstance(items, list):
+        return
 
     for it in items:
         if not isinstance(it, dict):
@@ -116,7 +150,7 @@ def parse_matches_api_json(json_text: str) -> list[dict]:
 
         match_key = "|".join([key_date, key_round, key_home, key_away]).strip("|")
 
-        results.append(
+        yield (
             {
                 "match_key": match_key,
                 "status": status,
@@ -133,5 +167,3 @@ def parse_matches_api_json(json_text: str) -> list[dict]:
                 "score_periods": score_periods,
             }
         )
-
-    return results
@@ -1,40 +1,41 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+from parsers.backend import Selector, parse_html
+from parsers.schema import Schema, field, node, text
+
+PAGE = Schema(
+    {
+        "title": field("h1", ".article__title", ".page-title", post=text(" ")),
+        "content": field(
+            "div.match-article",
+            'div[property="schema:text"]',
+            ".article-news__content",
+            "main",
+            post=node,
+        ),
+    }
+)
+
+_NOISE = Selector("script, style, noscript, .addtoany-sharebar, .share, .social")
 
 
 def parse_match_report_detail(html: str, base_url: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
-
-    title_el = (
-        soup.select_one("h1")
-        or soup.select_one(".article__title")
-        or soup.select_one(".page-title")
-    )
-    title = title_el.get_text(" ", strip=True) if title_el else None
-
-    content_root = (
-        soup.select_one("div.match-article")
-        or soup.select_one('div[property="schema:text"]')
-        or soup.select_one(".article-news__content")
-        or soup.select_one("main")
-    )
+    page = PAGE.extract(parse_html(html))
+    content_root = page["content"]
 
     content_html = ""
     content_text = ""
 
     if content_root:
-        for bad in content_root.select(
-            "script, style, noscript, .addtoany-sharebar, .share, .social"
-        ):
+        for bad in content_root.select(_NOISE):
             bad.decompose()
 
-        content_html = str(content_root)
+        content_html = content_root.outer_html()
         content_text = content_root.get_text("\n", strip=True)
 
     return {
         "type": "match_report",
-        "title": title,
+        "title": page["title"],
         "content_html": content_html,
         "content_text": content_text,
         "header_image_url": None,
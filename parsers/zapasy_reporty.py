@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import re
-from bs4 import BeautifulSoup
+
+from parsers.backend import Selector, parse_html
+from parsers.schema import Schema, field, node
+
+from utils.dates import parse_datetime_safe
 
 _DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")              # YYYY-MM-DD
 _TZ_FIX_RE = re.compile(r"([+-]\d{2}):(\d{2})$")         # +01:00 -> +0100
@@ -48,7 +52,32 @@ def _abs_url(base_url: str, href: str) -> str:
     return base_url.rstrip("/") + "/" + href
 
 
-def _pick_report_anchor(item) -> object | None:
+def _norm_text(n) -> str | None:
+    return _norm(n.get_text(" ", strip=True) if n is not None else None)
+
+
+PLAYED = Selector("#matches-list-played")
+ITEMS = Selector(".matches-list__item")
+
+ITEM = Schema(
+    {
+        "report_a": field(".matches-list__button--secondary a[href]", post=node),
+        "anchors": field("a[href]", post=node, many=True),
+        "time": field("time.matches-list__date", post=node),
+        "round": field(".matches-list__round", post=_norm_text),
+        "teams": field(".matches-list__team-names > .matches-list__team-name", post=_norm_text, many=True),
+    }
+)
+
+
+def _played_or_item(name: str, attrs: dict) -> bool:
+    """
+    bs4 strainer: played tab alebo samostatná položka zápasu (mimo tabu).
+    """
+    return attrs.get("id") == "matches-list-played" or "matches-list__item" in (attrs.get("class") or "").split()
+
+
+def _pick_report_anchor(raw: dict) -> object | None:
     """
     Na tvojom screenshote je:
       <div class="matches-list__button matches-list__button--secondary">
@@ -58,18 +87,17 @@ def _pick_report_anchor(item) -> object | None:
     Preto hľadáme primárne anchor v button--secondary a potom fallback.
     """
     # 1) presne podľa UI "Report" tlačidla
-    a = item.select_one(".matches-list__button--secondary a[href]")
-    if a:
-        return a
+    if raw["report_a"]:
+        return raw["report_a"]
 
     # 2) ak by zmenili triedy, stále nájdeme anchor s textom "Report"
-    for a in item.select("a[href]"):
+    for a in raw["anchors"]:
         txt = (_norm(a.get_text(" ", strip=True)) or "").lower()
         if txt == "report" or "report" in txt or "reportáž" in txt or "reportaz" in txt:
             return a
 
     # 3) posledný fallback: typická URL štruktúra reportov
-    for a in item.select("a[href]"):
+    for a in raw["anchors"]:
         href = (a.get("href") or "").strip()
         if "/a-muzstvo/zapasy/" in href:
             return a
@@ -93,14 +121,16 @@ def parse_match_reports(html: str, base_url: str) -> list[dict]:
     - join_key: iba YYYY-MM-DD + round + teams (na najspoľahlivejší join s API)
     - swapped verzie: keby bol v API opačný home/away
     """
-    soup = BeautifulSoup(html, "lxml")
     out: list[dict] = []
 
     # Extra bezpečnosť: ak stránka obsahuje aj upcoming aj played, zoberieme len played tab keď existuje
-    scope = soup.select_one("#matches-list-played") or soup
+    # (HTML sa parsuje raz – played tab aj položky zápasov; bez tabu sa berú všetky položky)
+    doc = parse_html(html, only=(_played_or_item, {}))
+    scope = doc.select_one(PLAYED) or doc
 
-    for item in scope.select(".matches-list__item"):
-        report_a = _pick_report_anchor(item)
+    for item in scope.select(ITEMS):
+        raw = ITEM.extract(item)
+        report_a = _pick_report_anchor(raw)
         if not report_a:
             continue
 
@@ -109,23 +139,20 @@ def parse_match_reports(html: str, base_url: str) -> list[dict]:
             continue
 
         # date
-        time_el = item.select_one("time.matches-list__date")
+        time_el = raw["time"]
         date_text = _norm(time_el.get_text(" ", strip=True) if time_el else None)
 
         date_iso = None
         if time_el and time_el.get("datetime"):
             date_iso = _norm_tz(_norm(time_el.get("datetime")))
-        date_day = _date_day_from_any(date_iso or date_text)
+        # bez datetime atribútu ostáva iba text ("sobota 22.11.2025 17:00")
+        date_day = _date_day_from_any(date_iso or date_text) or _date_day_from_any(parse_datetime_safe(date_text or ""))
 
         # round
-        round_el = item.select_one(".matches-list__round")
-        round_text = _norm(round_el.get_text(" ", strip=True) if round_el else None)
+        round_text = raw["round"]
 
         # teams
-        team_names = [
-            _norm(x.get_text(" ", strip=True))
-            for x in item.select(".matches-list__team-names > .matches-list__team-name")
-        ]
+        team_names = raw["teams"]
         team_1 = team_names[0] if len(team_names) > 0 else None
         team_2 = team_names[1] if len(team_names) > 1 else None
 
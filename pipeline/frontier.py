@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+KIND_ARTICLE = "article"
+KIND_MATCH_REPORT = "match_report"
+
+# vyššie číslo = skôr na rade
+PRIORITY_MATCH_REPORT = 80
+PRIORITY_ARTICLE = 50
+ARTICLE_RECENCY_BONUS_DAYS = 20  # čerstvé články dostanú až +20
+
+RETRY_BASE_S = 300.0
+RETRY_MAX_S = 24 * 3600.0
+MAX_ATTEMPTS = 6
+
+
+def _age_days(date_iso: str | None) -> int | None:
+    if not date_iso:
+        return None
+    try:
+        dt = datetime.fromisoformat(date_iso)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0, (datetime.now(timezone.utc) - dt).days)
+
+
+def article_item(card: dict) -> dict:
+    """
+    Karta z /novinky -> položka frontieru. Novšie články majú vyššiu prioritu.
+    """
+    age = _age_days(card.get("date_iso"))
+    bonus = 0 if age is None else max(0, ARTICLE_RECENCY_BONUS_DAYS - age)
+    return {
+        "url": card["url"],
+        "kind": KIND_ARTICLE,
+        "priority": PRIORITY_ARTICLE + bonus,
+        "payload": card,
+    }
+
+
+def report_item(match: dict) -> dict:
+    """
+    Zápas so spárovaným report_url -> položka frontieru (payload nesie match_key).
+    """
+    return {
+        "url": match["report_url"],
+        "kind": KIND_MATCH_REPORT,
+        "priority": PRIORITY_MATCH_REPORT,
+        "payload": {
+            "match_key": match["match_key"],
+            "date_iso": match.get("date_iso"),
+            "team_home": match.get("team_home"),
+            "team_away": match.get("team_away"),
+        },
+    }
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Exponenciálny odklad ďalšieho pokusu: 5 min, 10 min, 20 min, … max. 1 deň.
+    """
+    return min(RETRY_MAX_S, RETRY_BASE_S * (2 ** max(0, attempts)))
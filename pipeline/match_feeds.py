@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+
+@dataclass(frozen=True)
+class MatchFeed:
+    """
+    Jedna súťaž + sezóna v API zápasov (napr. extraliga 2025-2026).
+    """
+
+    league: str
+    season: str
+
+    def api_url(self, api_base: str) -> str:
+        return f"{api_base}?{urlencode({'league': self.league, 'season': self.season})}"
+
+    def __str__(self) -> str:
+        return f"{self.league}:{self.season}"
+
+
+def parse_feeds(spec: str | list[str] | tuple[str, ...]) -> list[MatchFeed]:
+    """
+    "extraliga:2025-2026,playoff:2025-2026" (alebo zoznam takých reťazcov) -> [MatchFeed, …].
+    Poradie ostáva, duplicity sa vynechajú.
+    """
+    parts = spec.split(",") if isinstance(spec, str) else list(spec)
+    feeds: list[MatchFeed] = []
+    for part in parts:
+        part = part.strip()
+        if not part:
+            continue
+        league, sep, season = part.partition(":")
+        if not sep or not league.strip() or not season.strip():
+            raise ValueError(f"Neplatný feed '{part}' – očakávam liga:sezóna, napr. extraliga:2025-2026")
+        feed = MatchFeed(league.strip(), season.strip())
+        if feed not in feeds:
+            feeds.append(feed)
+    return feeds
+
+
+def previous_seasons(current: str, count: int) -> list[str]:
+    """
+    "2025-2026", 3 -> ["2025-2026", "2024-2025", "2023-2024"].
+    """
+    start = int(current.split("-", 1)[0])
+    return [f"{y}-{y + 1}" for y in range(start, start - count, -1)]
+
+
+def backfill_feeds(leagues: tuple[str, ...], current_season: str, seasons: int) -> list[MatchFeed]:
+    return [MatchFeed(lg, s) for s in previous_seasons(current_season, seasons) for lg in leagues]
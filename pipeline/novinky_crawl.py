@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import requests
+
+from parsers.novinky import parse_novinky_list
+from utils.http_client import HTML_HEADERS
+
+
+@dataclass
+class NovinkyCrawlResult:
+    cards: list[dict] = field(default_factory=list)
+    pages: int = 0
+    stop_reason: str = ""
+    next_page: int = 0  # prvá strana, ktorá sa ešte nespracovala
+    finished: bool = False  # dosiahnutý koniec stránkovania
+
+
+class BackfillProgress:
+    """
+    Posledná spracovaná strana backfillu na disku – ďalší beh pokračuje odtiaľ
+    (limit requestov na beh inak stačí iba na tých istých prvých N strán).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> int:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+        page = data.get("next_page") if isinstance(data, dict) else None
+        return page if isinstance(page, int) and page > 0 else 0
+
+    def save(self, next_page: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"next_page": next_page}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def novinky_page_url(list_url: str, page: int) -> str:
+    # Drupal pager: prvá stránka je bez parametra, ďalšie ?page=1, ?page=2, …
+    return list_url if page == 0 else f"{list_url}?page={page}"
+
+
+def crawl_novinky(
+    http,
+    robots,
+    storage,
+    *,
+    list_url: str,
+    base_url: str,
+    limit: int,
+    known_streak: int,
+    max_pages: int,
+    backfill: bool,
+    logger,
+    start_page: int = 0,
+    stop_at_known: bool = True,
+    on_page: Callable[[int, list[dict]], None] | None = None,
+) -> NovinkyCrawlResult:
+    """
+    Prechádza /novinky?page=N od najnovších a zbiera karty článkov, ktoré ešte nie sú v DB.
+
+    - bežný beh: skončí, keď narazí na `known_streak` už známych článkov za sebou
+      (alebo keď má `limit` nových kariet) – sťahuje sa iba nová delta
+    - backfill: ide až na koniec stránkovania (alebo po `max_pages`), limit ignoruje;
+      `start_page` = pokračovanie predchádzajúceho backfillu
+    - stop_at_known=False: DB sa nepýta, každá karta sa berie ako nová (record/replay)
+    - on_page(strana, nové karty) sa volá hneď po spracovaní každej strany – karty sa
+      zaradia aj vtedy, keď neskôr ďalšia strana zlyhá alebo sa minie limit requestov
+    """
+    result = NovinkyCrawlResult(next_page=start_page)
+    seen: set[str] = set()
+    streak = 0
+
+    for page in range(start_page, start_page + max_pages):
+        page_url = novinky_page_url(list_url, page)
+        if not robots.can_fetch(page_url).allowed:
+            result.stop_reason = f"robots zakazuje {page_url}"
+            return result
+
+        try:
+            res = http.get(page_url, conditional=False, extra_headers=HTML_HEADERS)
+        except requests.RequestException as e:
+            # 404 za poslednou stranou alebo 5xx po retry – beh pokračuje (zápasy, frontier)
+            logger.warning(f"Novinky strana {page}: chyba ({e}).")
+            result.stop_reason = f"strana {page}: chyba"
+            return result
+        html = res.text or ""
+        result.pages += 1
+        if res.status_code != 200 or not html.strip():
+            logger.warning(f"Novinky strana {page}: bez obsahu alebo status={res.status_code}.")
+            result.stop_reason = f"strana {page} bez obsahu"
+            return result
+
+        # na konci stránkovania Drupal vracia prázdny zoznam alebo opakuje poslednú stranu
+        cards = [c for c in parse_novinky_list(html, base_url, limit=10**6) if c["url"] not in seen]
+        if not cards:
+            result.stop_reason = "koniec stránkovania"
+            result.finished = True
+            return result
+
+        known = storage.known_article_urls([c["url"] for c in cards]) if stop_at_known else set()
+        new: list[dict] = []
+        stop = ""
+        for c in cards:
+            seen.add(c["url"])
+            if c["url"] in known:
+                streak += 1
+                if not backfill and streak >= known_streak:
+                    stop = f"{streak} známych článkov za sebou"
+                    break
+                continue
+
+            streak = 0
+            new.append(c)
+            if not backfill and len(result.cards) + len(new) >= limit:
+                stop = f"limit {limit} nových kariet"
+                break
+
+        result.cards += new
+        result.next_page = page + 1
+        if on_page is not None:
+            on_page(page, new)
+        if stop:
+            result.stop_reason = stop
+            return result
+
+    result.stop_reason = f"max. {max_pages} strán"
+    return result
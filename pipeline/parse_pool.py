@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable
+
+from parsers.backend import get_backend, set_backend
+
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class ParsePool:
+    """
+    Parsovanie (CPU) v samostatných procesoch, kým hlavné vlákno sťahuje a zapisuje do DB.
+
+    - workers <= 0: parsuje sa priamo v hlavnom procese (bežný beh – štart procesov by bol drahší)
+    - naraz je rozpracovaných najviac `max_pending` úloh; submit() dovtedy čaká na hotové,
+      takže v pamäti nikdy nevisí viac HTML tiel ako je limit
+    - výsledky sa vracajú v poradí dokončenia ako (tag, výsledok); výnimka z parsera je výsledok
+    - jeden pool na beh (RunContext) – daemon ho zdieľa medzi všetkými drain_frontier
+    """
+
+    def __init__(self, workers: int, max_pending: int | None = None) -> None:
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending or self.workers * 4)
+        self._pool: ProcessPoolExecutor | None = None
+        if self.workers:
+            # worker musí parsovať tým istým backendom ako hlavný proces; workery vznikajú
+            # lenivo pri prvom submit(), keď už bežia vlákna get_many – fork viacvláknového
+            # procesu sa môže zaseknúť, preto forkserver (resp. spawn, kde forkserver nie je)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(_START_METHOD),
+                initializer=set_backend,
+                initargs=(get_backend(),),
+            )
+        self._pending: dict[Future, Any] = {}
+
+    def submit(self, tag: Any, fn: Callable, *args) -> list[tuple[Any, Any]]:
+        """
+        Zaradí fn(*args). Vracia úlohy, ktoré sa medzitým dokončili (inline režim: hneď túto).
+        """
+        if self._pool is None:
+            try:
+                return [(tag, fn(*args))]
+            except Exception as e:
+                return [(tag, e)]
+
+        done: list[tuple[Any, Any]] = []
+        while len(self._pending) >= self.max_pending:
+            done += self._collect()
+        self._pending[self._pool.submit(fn, *args)] = tag
+        return done
+
+    def drain(self) -> list[tuple[Any, Any]]:
+        done: list[tuple[Any, Any]] = []
+        while self._pending:
+            done += self._collect()
+        return done
+
+    def _collect(self) -> list[tuple[Any, Any]]:
+        finished, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+        out = []
+        for fut in finished:
+            tag = self._pending.pop(fut)
+            exc = fut.exception()
+            out.append((tag, exc if exc is not None else fut.result()))
+        return out
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> ParsePool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
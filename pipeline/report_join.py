@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_ROUND_NUM_RE = re.compile(r"\d+")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+# označenia typu klubu, ktoré sa medzi HTML a API líšia ("HC Košice" vs "HK Košice")
+_CLUB_PREFIXES = frozenset({"hc", "hk", "hkm", "mhk", "mhc", "shk", "hkl", "ehc", "ec"})
+
+# normalizovaný názov (bez diakritiky, malé písmená, bez prefixu klubu) -> kanonický tvar
+TEAM_ALIASES: dict[str, str] = {
+    "snv": "spisska nova ves",
+    "spisska n ves": "spisska nova ves",
+    "b bystrica": "banska bystrica",
+    "bbystrica": "banska bystrica",
+    "l mikulas": "liptovsky mikulas",
+    "lm": "liptovsky mikulas",
+    "dukla michalovce": "michalovce",
+    "dukla trencin": "trencin",
+    "slovan bratislava": "slovan",
+    "bratislava slovan": "slovan",
+    "05 banska bystrica": "banska bystrica",
+}
+
+
+def _fold(s: str) -> str:
+    s = unicodedata.normalize("NFKD", s.replace("\xa0", " "))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).casefold()
+    return " ".join(_NON_WORD_RE.sub(" ", s).split())
+
+
+def team_key(name: str | None, aliases: dict[str, str] | None = None) -> str:
+    """
+    "HK\xa0Spišská Nová Ves" / "HC Spisska Nova Ves" / "SNV" -> "spisska nova ves".
+    """
+    words = _fold(name or "").split()
+    while len(words) > 1 and words[0] in _CLUB_PREFIXES:
+        words = words[1:]
+    key = " ".join(words)
+    table = TEAM_ALIASES if aliases is None else {**TEAM_ALIASES, **aliases}
+    return table.get(key, key)
+
+
+def round_key(round_text: str | None) -> str:
+    """
+    "22. kolo" / "22" / "Kolo 22" -> "22"; bez čísla zložený text (napr. "stvrtfinale").
+    """
+    m = _ROUND_NUM_RE.search(round_text or "")
+    return m.group(0) if m else _fold(round_text or "")
+
+
+def date_day(date_iso_or_text: str | None) -> str:
+    m = _DATE_RE.search(date_iso_or_text or "")
+    return m.group(0) if m else ""
+
+
+@dataclass
+class JoinStats:
+    reports: int = 0
+    lookups: int = 0
+    exact: int = 0  # deň + dvojica tímov + kolo
+    fallback: int = 0  # deň + dvojica tímov, kolo sa nezhoduje / chýba
+    missed: int = 0
+    misses: list[str] = field(default_factory=list)  # prvých pár kľúčov na ladenie
+
+    @property
+    def matched(self) -> int:
+        return self.exact + self.fallback
+
+    @property
+    def rate(self) -> float:
+        return self.matched / self.lookups if self.lookups else 0.0
+
+
+class ReportIndex:
+    """
+    Index report_url z parse_match_reports pre join so zápasmi z API.
+
+    Kľúč = (deň, zoradená dvojica normalizovaných tímov[, kolo]) – poradie doma/vonku,
+    prefix klubu (HC/HK), diakritika ani zápis kola ("22. kolo" vs "22") join nerozbijú.
+    Keď sa kolo nezhoduje, použije sa report dvojice v ten deň, ak je jediný.
+    """
+
+    MAX_MISSES = 5
+
+    def __init__(self, report_items: list[dict], aliases: dict[str, str] | None = None) -> None:
+        self._aliases = aliases
+        self._exact: dict[tuple[str, tuple[str, str], str], str] = {}
+        self._by_pair: dict[tuple[str, tuple[str, str]], set[str]] = {}
+        self._used: set[str] = set()
+        self.stats = JoinStats()
+
+        for x in report_items:
+            url = (x.get("report_url") or "").strip()
+            if not url:
+                continue
+            pair = self._pair(x.get("team_1"), x.get("team_2"))
+            if pair is None:
+                continue
+            day = date_day(x.get("date_day") or x.get("date_iso"))
+            self._exact.setdefault((day, pair, round_key(x.get("round"))), url)
+            self._by_pair.setdefault((day, pair), set()).add(url)
+            self.stats.reports += 1
+
+    def _pair(self, a: str | None, b: str | None) -> tuple[str, str] | None:
+        ka, kb = team_key(a, self._aliases), team_key(b, self._aliases)
+        if not ka or not kb:
+            return None
+        return (ka, kb) if ka <= kb else (kb, ka)
+
+    def __len__(self) -> int:
+        return self.stats.reports
+
+    def lookup(self, match: dict) -> str | None:
+        """
+        report_url pre zápas z API (date_iso, round, team_home, team_away) alebo None.
+        """
+        self.stats.lookups += 1
+        pair = self._pair(match.get("team_home"), match.get("team_away"))
+        day = date_day(match.get("date_iso") or match.get("date_text"))
+
+        url = None
+        if pair is not None:
+            url = self._exact.get((day, pair, round_key(match.get("round"))))
+            if url is not None:
+                self.stats.exact += 1
+            else:
+                candidates = self._by_pair.get((day, pair))
+                if candidates and len(candidates) == 1:
+                    url = next(iter(candidates))
+                    self.stats.fallback += 1
+
+        if url is None:
+            self.stats.missed += 1
+            if len(self.stats.misses) < self.MAX_MISSES:
+                self.stats.misses.append(f"{day}|{round_key(match.get('round'))}|{pair}")
+            return None
+
+        self._used.add(url)
+        return url
+
+    def unused(self) -> list[str]:
+        """
+        Reporty z HTML, ku ktorým sa nenašiel žiadny zápas z API.
+        """
+        urls = {u for us in self._by_pair.values() for u in us}
+        return sorted(urls - self._used)
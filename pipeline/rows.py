@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from parsers.article import parse_article
+from parsers.zapasy_report_detail import parse_match_report_detail
+
+# Čisté funkcie HTML -> riadok do DB. Bežia aj v procesoch ParsePool,
+# preto musia byť na úrovni modulu a brať iba picklovateľné argumenty.
+
+
+def article_row(url: str, html: str, card: dict, base_url: str) -> dict:
+    parsed = parse_article(html, base_url)
+    if parsed["type"] == "type1":
+        parsed_date_text = card.get("date_text")
+        parsed_date_iso = card.get("date_iso")
+    else:
+        parsed_date_text = parsed.get("date_text") or card.get("date_text")
+        parsed_date_iso = parsed.get("date_iso") or card.get("date_iso")
+
+    return {
+        "url": url,
+        "type": parsed["type"],
+        "title": parsed.get("title") or card.get("title"),
+        "date_text": parsed_date_text,
+        "date_iso": parsed_date_iso,
+        "card_image_url": card.get("card_image_url"),
+        "header_image_url": parsed.get("header_image_url"),
+        "match_datetime_text": parsed.get("match_datetime_text"),
+        "match_datetime_iso": parsed.get("match_datetime_iso"),
+        "match_round": parsed.get("match_round"),
+        "match_score": parsed.get("match_score"),
+        "match_is_win": parsed.get("match_is_win"),
+        "match_logo_home_url": parsed.get("match_logo_home_url"),
+        "match_logo_away_url": parsed.get("match_logo_away_url"),
+        "content_html": parsed.get("content_html") or "",
+        "content_text": parsed.get("content_text") or "",
+    }
+
+
+def match_report_row(url: str, html: str, payload: dict, base_url: str) -> dict:
+    parsed = parse_match_report_detail(html, base_url)
+    return {
+        "match_key": payload["match_key"],
+        "report_url": url,
+        "title": parsed.get("title"),
+        "content_html": parsed.get("content_html") or "",
+        "content_text": parsed.get("content_text") or "",
+    }
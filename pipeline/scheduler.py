@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+# adaptívny interval: po zmene sa skráti, bez zmeny sa postupne predlžuje
+SHRINK_ON_CHANGE = 0.5
+GROW_ON_NO_CHANGE = 1.5
+
+
+@dataclass
+class Target:
+    """
+    Jeden periodicky kontrolovaný cieľ (zoznam noviniek, API zápasov, článok, …).
+
+    - interval sa učí z toho, ako často sa cieľ reálne mení (min_interval..max_interval)
+    - game_interval: horný strop intervalu počas zápasového okna (None = bez sprísnenia)
+    """
+
+    name: str
+    run: Callable[[], bool]  # vracia True, ak sa obsah zmenil
+    interval: float
+    min_interval: float
+    max_interval: float
+    game_interval: float | None = None
+    next_due: float = 0.0
+    runs: int = 0
+    changes: int = 0
+
+    def observe(self, changed: bool) -> None:
+        self.runs += 1
+        if changed:
+            self.changes += 1
+            self.interval = max(self.min_interval, self.interval * SHRINK_ON_CHANGE)
+        else:
+            self.interval = min(self.max_interval, self.interval * GROW_ON_NO_CHANGE)
+
+
+@dataclass
+class GameWindow:
+    """
+    Okno okolo začiatku zápasu (z matches.date_iso), kedy sa ciele kontrolujú častejšie.
+    """
+
+    before_s: float
+    after_s: float
+    starts: list[float] = field(default_factory=list)  # unix timestamps
+
+    def set_match_times(self, date_isos: Iterable[str | None]) -> None:
+        starts = []
+        for d in date_isos:
+            if not d:
+                continue
+            try:
+                dt = datetime.fromisoformat(d)
+            except ValueError:
+                continue
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            starts.append(dt.timestamp())
+        self.starts = sorted(starts)
+
+    def active(self, now: float) -> bool:
+        return any(s - self.before_s <= now <= s + self.after_s for s in self.starts)
+
+    def next_start(self, now: float) -> float | None:
+        """
+        Najbližší začiatok zápasového okna v budúcnosti (na prebudenie daemonu).
+        """
+        for s in self.starts:
+            if s - self.before_s > now:
+                return s - self.before_s
+        return None
+
+
+class Scheduler:
+    def __init__(self, game_window: GameWindow, logger) -> None:
+        self.game_window = game_window
+        self.log = logger
+        self._targets: dict[str, Target] = {}
+        self._stop = threading.Event()
+
+    # --- ciele ---
+    def add(self, target: Target) -> None:
+        existing = self._targets.get(target.name)
+        if existing is not None:
+            # už známy cieľ si nechá naučený interval aj termín
+            existing.run = target.run
+            return
+        self._targets[target.name] = target
+
+    def remove(self, name: str) -> None:
+        self._targets.pop(name, None)
+
+    def names(self, prefix: str = "") -> list[str]:
+        return [n for n in self._targets if n.startswith(prefix)]
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    # --- plánovanie ---
+    def effective_interval(self, target: Target, now: float) -> float:
+        if target.game_interval is not None and self.game_window.active(now):
+            return min(target.interval, target.game_interval)
+        return target.interval
+
+    def _due_time(self, target: Target, now: float) -> float:
+        due = target.next_due
+        # zápasové okno môže termín posunúť dopredu (a pri jeho začiatku treba hneď reagovať)
+        if target.game_interval is not None and target.runs:
+            last_run = target.next_due - target.interval
+            if self.game_window.active(now):
+                due = min(due, last_run + target.game_interval)
+            else:
+                ws = self.game_window.next_start(now)
+                if ws is not None and ws < due:
+                    due = ws
+        return due
+
+    def next_target(self) -> tuple[Target, float] | None:
+        if not self._targets:
+            return None
+        now = time.time()
+        return min(((t, self._due_time(t, now)) for t in self._targets.values()), key=lambda x: x[1])
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def run_forever(self, on_tick: Callable[[], None] | None = None) -> None:
+        """
+        Hlavná slučka: počká na najbližší splatný cieľ, spustí ho a prepočíta jeho interval.
+        `on_tick` sa volá po každom cieli (checkpoint, reset rozpočtu requestov…).
+        """
+        while not self._stop.is_set():
+            nxt = self.next_target()
+            if nxt is None:
+                self._stop.wait(60.0)
+                continue
+
+            target, due = nxt
+            delay = due - time.time()
+            if delay > 0:
+                # prebúdzame sa aspoň raz za minútu – ciele sa medzitým môžu zmeniť
+                self._stop.wait(min(delay, 60.0))
+                continue
+
+            changed = False
+            try:
+                changed = bool(target.run())
+            except Exception as e:
+                self.log.exception(f"Daemon: cieľ {target.name} zlyhal: {e}")
+
+            if target.name not in self._targets:
+                continue
+            target.observe(changed)
+            now = time.time()
+            target.next_due = now + target.interval
+            self.log.info(
+                f"Daemon: {target.name} | zmena={changed} | ďalší o "
+                f"{self.effective_interval(target, now):.0f}s"
+            )
+
+            if on_tick is not None:
+                try:
+                    on_tick()
+                except Exception as e:
+                    self.log.exception(f"Daemon: on_tick po cieli {target.name} zlyhal: {e}")
@@ -2,25 +2,47 @@ from __future__ import annotations
 
 import argparse
 import logging
+import random
 import re
+import signal
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
 
 from config import Config
 from storage import Storage
-from utils.http_client import HttpClient, RequestLimitExceeded
-from utils.robots import RobotsChecker
-from parsers.novinky import parse_novinky_list
-from parsers.article_type1 import parse_article_type1
-from parsers.article_type2 import parse_article_type2
-from parsers.zapasy_api import parse_matches_api_json
+from utils.http_client import HTML_HEADERS, HttpClient, RequestLimitExceeded
+from utils.replay import install_recorder, install_replay, is_recording
+from utils.response_cache import ResponseCache
+from utils.robots import RobotsCache, RobotsChecker, fetch_robots
+from pipeline.match_feeds import MatchFeed, backfill_feeds, parse_feeds
+from pipeline.frontier import (
+    KIND_ARTICLE,
+    KIND_MATCH_REPORT,
+    MAX_ATTEMPTS,
+    article_item,
+    report_item,
+    retry_delay,
+)
+from pipeline.novinky_crawl import BackfillProgress, crawl_novinky
+from pipeline.parse_pool import ParsePool
+from pipeline.report_join import ReportIndex
+from pipeline.rows import article_row, match_report_row
+from pipeline.scheduler import GameWindow, Scheduler, Target
+from parsers.backend import available_backends, set_backend
+from parsers.zapasy_api import iter_matches_api_json
 from parsers.zapasy_reporty import parse_match_reports
 
 _DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
+# frontier kind -> (HTML -> riadok) a meno do logu
+_ROW_BUILDERS = {KIND_ARTICLE: article_row, KIND_MATCH_REPORT: match_report_row}
+_KIND_LABELS = {KIND_ARTICLE: "Článok", KIND_MATCH_REPORT: "Report"}
+
 
 def setup_logging(log_dir: Path) -> logging.Logger:
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -45,46 +67,33 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     return logger
 
 
-def detect_article_type(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    if soup.select_one("div.match-banner"):
-        return "type1"
-    if soup.select_one("div.article-news__header-image") or soup.select_one('div[property="schema:text"]'):
-        return "type2"
-    return "type2"
-
-
-def fetch_robots_unconditional(url: str, user_agent: str, timeout: int) -> str | None:
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/plain,*/*;q=0.8",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
-    try:
-        r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-        if r.status_code == 200:
-            txt = (r.text or "").strip()
-            return txt or None
-        return None
-    except Exception:
-        return None
+@dataclass
+class RunContext:
+    cfg: Config
+    args: argparse.Namespace
+    storage: Storage
+    http: HttpClient
+    robots: RobotsChecker
+    logger: logging.Logger
+    feeds: list[MatchFeed] = field(default_factory=list)  # API zápasov: liga × sezóna
+    parse_pool: ParsePool = field(default_factory=lambda: ParsePool(0))  # jeden na beh, zatvára main
 
 
-def fetch_html_unconditional(url: str, user_agent: str, timeout: int) -> tuple[int, str]:
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
-    r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    return r.status_code, (r.text or "")
+@dataclass
+class MatchesResult:
+    allowed: bool
+    api_hash: str | None = None
+    html_hash: str | None = None
+    report_items: list[dict] = field(default_factory=list)  # reporty zaradené do frontieru
 
 
-def _normalize_key(s: str) -> str:
-    # NBSP + whitespace collapse
-    return " ".join((s or "").replace("\xa0", " ").strip().split())
+def memory_frontier(args: argparse.Namespace) -> bool:
+    """
+    --dry-run, --record a --replay nesiahajú na perzistentný frontier (ani na postup backfillu):
+    položky žijú iba v pamäti behu, aby replay 404-kami neodstavoval produkčné riadky
+    a nahrávka/replay vždy prešli celú deltu bez ohľadu na stav DB.
+    """
+    return bool(args.dry_run or args.record or args.replay)
 
 
 def _date_day_from_iso(date_iso: str | None) -> str | None:
@@ -94,16 +103,467 @@ def _date_day_from_iso(date_iso: str | None) -> str | None:
     return m.group(0) if m else None
 
 
-def _join_key_day(date_iso: str | None, round_text: str | None, home: str | None, away: str | None) -> str:
-    date_day = _date_day_from_iso(date_iso) or ""
-    return "|".join(
-        [
-            date_day.strip(),
-            (round_text or "").strip(),
-            (home or "").strip(),
-            (away or "").strip(),
-        ]
-    ).strip("|")
+def needs_parse(ctx: RunContext, kind: str, url: str, detail_res) -> bool:
+    label = _KIND_LABELS.get(kind, kind)
+
+    if detail_res.status_code == 304:
+        ctx.logger.info(f"{label} nezmenený (304): {url}")
+        return False
+
+    if detail_res.unchanged:
+        ctx.logger.info(f"{label} nezmenený (hash): {url}")
+        return False
+
+    if not detail_res.text:
+        ctx.logger.warning(f"{label} bez obsahu: {url}")
+        return False
+
+    return True
+
+
+def apply_robots_rate(cfg: Config, http: HttpClient, robots: RobotsChecker, logger: logging.Logger) -> None:
+    """
+    Crawl-delay/Request-rate z robots.txt pre BASE_URL: prísnejší limit než HOST_RPS platí
+    s burst 1 (žiadne dávky nad limit stránky); keď ho robots.txt už neuvádza, vráti sa HOST_RPS/HOST_BURST.
+    """
+    robots_rps = robots.max_rps()
+    if robots_rps and robots_rps < cfg.HOST_RPS:
+        rate, burst = robots_rps, 1.0
+    else:
+        rate, burst = cfg.HOST_RPS, cfg.HOST_BURST
+    if rate == http.limiter.rate_for(cfg.BASE_URL):
+        return
+    http.limiter.set_rate(cfg.BASE_URL, rate, burst)
+    logger.info(f"robots.txt Crawl-delay/Request-rate: limit {rate:.3f} req/s (burst {burst:g})")
+
+
+def store_row(ctx: RunContext, kind: str, row: dict, detail_res) -> None:
+    """
+    Riadok ide do write-behind bufferu Storage; do DB sa dostane pri najbližšom checkpointe.
+    """
+    logger = ctx.logger
+
+    if kind == KIND_ARTICLE:
+        if ctx.args.dry_run:
+            logger.info(f"[DRY-RUN] článok: {row['type']} | {row['title']} | {row['url']}")
+            return
+        ctx.storage.buffer_article(row)
+    else:
+        if ctx.args.dry_run:
+            logger.info(f"[DRY-RUN] report: {row['match_key']} | {row['title']} | {row['report_url']}")
+            return
+        ctx.storage.buffer_match_report(row)
+
+    ctx.http.remember(detail_res)
+
+
+def checkpoint(ctx: RunContext, force: bool = False) -> None:
+    """
+    Zapíše buffer Storage (články, reporty, hotový frontier, http_meta) v jednej transakcii –
+    keď je splatný (počet riadkov / čas), pri `force` vždy.
+    """
+    if ctx.args.dry_run:
+        return
+    res = ctx.storage.flush() if force else ctx.storage.flush_if_due()
+    if not res:
+        return
+
+    logger = ctx.logger
+    for url, outcome in res.articles.items():
+        if outcome == "insert":
+            logger.info(f"INSERT článok: {url}")
+        elif outcome == "update":
+            logger.info(f"UPDATE článok: {url}")
+        else:
+            logger.info(f"Článok bez zmeny v DB: {url}")
+    for match_key, outcome in res.reports.items():
+        logger.info(f"{outcome.upper()} report: {match_key}")
+    logger.info(
+        f"DB checkpoint: články {len(res.articles)} | reporty {len(res.reports)} | "
+        f"frontier hotovo {res.frontier_done} | http_meta {res.meta}"
+    )
+
+
+def process_article(ctx: RunContext, url: str, detail_res, card: dict) -> None:
+    if needs_parse(ctx, KIND_ARTICLE, url, detail_res):
+        row = article_row(url, detail_res.text, card, ctx.cfg.BASE_URL)
+        store_row(ctx, KIND_ARTICLE, row, detail_res)
+
+
+def run_novinky(ctx: RunContext) -> list[dict]:
+    """
+    Nájde nové články na /novinky a po stranách ich zaradí do frontieru (pri memory_frontier() iba v pamäti).
+    Vracia nové položky frontieru.
+    """
+    cfg, args = ctx.cfg, ctx.args
+    max_pages = args.max_pages or (cfg.NOVINKY_BACKFILL_MAX_PAGES if args.backfill else cfg.NOVINKY_MAX_PAGES)
+
+    in_memory = memory_frontier(args)
+    progress = BackfillProgress(cfg.NOVINKY_BACKFILL_STATE_PATH) if args.backfill and not in_memory else None
+    # o stranu späť – medzitým pribudnuté články posúvajú karty na ďalšie strany
+    start_page = max(0, progress.load() - 1) if progress is not None else 0
+    if start_page:
+        ctx.logger.info(f"Novinky backfill: pokračujem od strany {start_page}.")
+
+    items: list[dict] = []
+
+    def on_page(page: int, cards: list[dict]) -> None:
+        page_items = [article_item(c) for c in cards]
+        items.extend(page_items)
+        if not in_memory:
+            ctx.storage.frontier_push(page_items)
+        if progress is not None:
+            progress.save(page + 1)
+
+    crawl = crawl_novinky(
+        ctx.http,
+        ctx.robots,
+        ctx.storage,
+        list_url=cfg.NOVINKY_URL,
+        base_url=cfg.BASE_URL,
+        limit=args.novinky_limit,
+        known_streak=cfg.NOVINKY_KNOWN_STREAK,
+        max_pages=max_pages,
+        backfill=args.backfill,
+        logger=ctx.logger,
+        start_page=start_page,
+        on_page=on_page,
+        # nahrávka/replay: známe články z DB nezastavia crawl (deterministický obsah nahrávky)
+        stop_at_known=not (args.record or args.replay),
+    )
+    ctx.logger.info(
+        f"Novinky: {len(crawl.cards)} nových kariet zo {crawl.pages} strán "
+        f"({'backfill' if args.backfill else f'limit {args.novinky_limit}'}) | stop: {crawl.stop_reason}"
+    )
+    if progress is not None and crawl.finished:
+        progress.clear()
+        ctx.logger.info("Novinky backfill: koniec stránkovania – ďalší backfill začne od začiatku.")
+
+    return items
+
+
+def drain_frontier(ctx: RunContext, memory_items: list[dict], kinds: tuple[str, ...] | None = None) -> None:
+    """
+    Stiahne a spracuje splatné položky frontieru v poradí priority (voliteľne iba `kinds`).
+    Hotové položky z frontieru zmiznú, neúspešné dostanú odklad; čo sa nestihne
+    (limit requestov), ostane na ďalší beh. Pri memory_frontier() sa spracujú `memory_items`.
+    """
+    storage, logger = ctx.storage, ctx.logger
+    in_memory = memory_frontier(ctx.args)
+
+    if in_memory:
+        due = [it for it in memory_items if kinds is None or it["kind"] in kinds]
+    else:
+        due = storage.frontier_due(limit=ctx.http.max_requests_per_run, kinds=kinds)
+    if not due:
+        logger.info("Frontier: nič splatné.")
+        return
+
+    items: dict[str, dict] = {}
+    allowed = set(ctx.robots.filter_allowed(it["url"] for it in due))
+    for it in due:
+        url = it["url"]
+        if url not in allowed:
+            logger.warning(f"Preskakujem (robots): {url}")
+            if not in_memory:
+                storage.frontier_done(url)
+            continue
+        items.setdefault(url, it)
+
+    logger.info(f"Frontier: {len(items)} položiek na stiahnutie.")
+
+    def finish(url: str, error: Exception | None) -> None:
+        if error is None:
+            if not in_memory:
+                storage.frontier_done(url)
+            checkpoint(ctx)
+            return
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        attempts = int(items[url].get("attempts") or 0) + 1
+        logger.warning(f"Frontier: pokus {attempts}/{MAX_ATTEMPTS} zlyhal ({error}) – {url}")
+        if not in_memory:
+            storage.frontier_failed(url, status, retry_delay(attempts - 1), MAX_ATTEMPTS)
+
+    def complete(done: list) -> None:
+        for (url, res), row in done:
+            if isinstance(row, Exception):
+                finish(url, row)
+                continue
+            try:
+                store_row(ctx, items[url]["kind"], row, res)
+            except Exception as e:
+                finish(url, e)
+                continue
+            finish(url, None)
+
+    # detaily sťahujeme súbežne (tempo drží per-host rate limiter v HttpClient),
+    # parsujú sa v ParsePool a riadky sa zapisujú tu, v hlavnom vlákne
+    pool = ctx.parse_pool
+    try:
+        for url, res in ctx.http.get_many(items, conditional=True, return_exceptions=True):
+            it = items[url]
+            if isinstance(res, Exception):
+                finish(url, res)
+                continue
+
+            build = _ROW_BUILDERS.get(it["kind"])
+            if build is None:
+                logger.warning(f"Frontier: neznámy typ '{it['kind']}' – {url}")
+                finish(url, None)
+                continue
+            if not needs_parse(ctx, it["kind"], url, res):
+                finish(url, None)
+                continue
+
+            complete(pool.submit((url, res), build, url, res.text, it.get("payload") or {}, ctx.cfg.BASE_URL))
+    finally:
+        # aj pri limite requestov dopíšeme, čo sa už stiahlo a parsuje
+        complete(pool.drain())
+
+
+def run_matches(ctx: RunContext) -> MatchesResult:
+    """
+    Zápasy z API + report_url z HTML stránky zápasov. allowed=False = zakázané robots.txt.
+    Hashe tiel odpovedí slúžia daemonu na zistenie, či sa niečo zmenilo.
+    """
+    cfg, args, storage, http, logger = ctx.cfg, ctx.args, ctx.storage, ctx.http, ctx.logger
+
+    if not ctx.robots.can_fetch(cfg.ZAPASY_URL).allowed:
+        logger.error(f"Zakázané robots.txt: {cfg.ZAPASY_URL}")
+        return MatchesResult(allowed=False)
+
+    # HTML (reporty) – chyba stránky nesmie zastaviť API feedy ani frontier, reporty sa iba preskočia
+    html_res = None
+    try:
+        html_res = http.get(cfg.ZAPASY_URL, conditional=False, extra_headers=HTML_HEADERS)
+    except requests.RequestException as e:
+        logger.warning(f"Zápasy HTML: chyba ({e}) – reporty preskakujem.")
+
+    report_items = []
+    if html_res is not None:
+        html_text = (html_res.text or "").strip()
+        if html_res.status_code == 200 and html_text:
+            report_items = parse_match_reports(html_text, cfg.BASE_URL)
+        else:
+            logger.warning(f"Zápasy HTML: bez obsahu alebo status={html_res.status_code} – reporty preskakujem.")
+
+    reports = ReportIndex(report_items)
+    logger.info(f"Reporty: items={len(report_items)} | index={len(reports)}")
+    if report_items:
+        logger.info(f"Report sample item: {report_items[0]}")
+
+    # API zápasy – všetky feedy (liga × sezóna) súbežne, tempo drží rate limiter
+    api_headers = {
+        "Accept": "application/json, text/plain, */*",
+        "X-Requested-With": "XMLHttpRequest",
+        "Referer": cfg.ZAPASY_URL,
+        "Origin": cfg.BASE_URL,
+    }
+    feeds = {f.api_url(cfg.ZAPASY_API_BASE): f for f in ctx.feeds}
+
+    api_hashes: dict[str, str | None] = {}
+    rows: list[dict] = []  # všetky feedy -> jeden batch upsert na konci
+    with_report: list[dict] = []
+    for api_url, api_res in http.get_many(
+        feeds, conditional=False, extra_headers=api_headers, return_exceptions=True
+    ):
+        feed = feeds[api_url]
+        if isinstance(api_res, Exception):
+            logger.warning(f"Zápasy API {feed}: chyba ({api_res}) – preskakujem.")
+            continue
+        api_hashes[api_url] = api_res.body_hash
+
+        json_text = (api_res.text or "").strip()
+        if api_res.status_code != 200 or not json_text:
+            logger.warning(f"Zápasy API {feed}: bez obsahu alebo status={api_res.status_code} – preskakujem.")
+            continue
+
+        join_reports = feed.season == cfg.CURRENT_SEASON  # HTML má reporty iba aktuálnej sezóny
+        total = 0
+        joined_before = reports.stats.matched
+        played = 0
+
+        for m in iter_matches_api_json(json_text):
+            total += 1
+            if total == 1:
+                logger.info(f"API sample match: {m}")
+            m["league"] = feed.league
+            m["season"] = feed.season
+            m["report_url"] = None
+
+            # reporty majú iba odohrané zápasy
+            if join_reports and m.get("status") == "played":
+                played += 1
+                m["report_url"] = reports.lookup(m)
+                if m["report_url"]:
+                    with_report.append(m)
+
+            if args.dry_run:
+                logger.info(
+                    "[DRY-RUN] zápas: "
+                    f"{feed} | {m.get('status')} | {m.get('team_home')} vs {m.get('team_away')} | "
+                    f"{m.get('date_text')} | report={bool(m.get('report_url'))}"
+                )
+            else:
+                rows.append(m)
+
+        logger.info(f"Zápasy {feed}: našlo sa {total} položiek (API).")
+        if join_reports:
+            logger.info(
+                f"Reporty spárované k zápasom ({feed}): {reports.stats.matched - joined_before}/{played} odohraných"
+            )
+
+    if rows:
+        flags = storage.upsert_matches(rows)
+        inserted = sum(1 for ins, _ in flags if ins)
+        logger.info(f"Zápasy uložené: {len(rows)} ({inserted} nových, {len(rows) - inserted} aktualizovaných).")
+    queued = enqueue_reports(ctx, with_report)
+
+    if reports.stats.lookups:
+        st = reports.stats
+        logger.info(
+            f"Report join: {st.matched}/{st.lookups} ({st.rate:.0%}) | presne={st.exact} "
+            f"| bez kola={st.fallback} | bez reportu={st.missed}"
+        )
+        for key in st.misses:
+            logger.info(f"MISS report join | {key}")
+        unused = reports.unused()
+        if unused:
+            logger.warning(f"Reporty bez zápasu z API: {len(unused)} (napr. {unused[0]})")
+
+    return MatchesResult(
+        allowed=True,
+        api_hash="|".join(f"{u}={api_hashes[u]}" for u in sorted(api_hashes)),
+        html_hash=html_res.body_hash if html_res is not None else None,
+        report_items=queued,
+    )
+
+
+def enqueue_reports(ctx: RunContext, matches: list[dict]) -> list[dict]:
+    """
+    Reporty do frontieru: ešte neuložené + reporty nedávno odohraných zápasov
+    (tie sa po zápase často dopĺňajú – overí ich lacný conditional GET).
+    Vracia zaradené položky (pri memory_frontier() iba v pamäti, a to všetky reporty).
+    """
+    with_report = [m for m in matches if m.get("report_url") and m.get("match_key")]
+    if not with_report:
+        return []
+
+    in_memory = memory_frontier(ctx.args)
+    known = set() if in_memory else ctx.storage.known_report_urls(m["report_url"] for m in with_report)
+    since = (date.today() - timedelta(days=ctx.cfg.REPORT_RECHECK_DAYS)).isoformat()
+    items = [
+        report_item(m)
+        for m in with_report
+        if m["report_url"] not in known or (_date_day_from_iso(m.get("date_iso")) or "") >= since
+    ]
+
+    new = sum(1 for m in with_report if m["report_url"] not in known)
+    ctx.logger.info(f"Reporty: {len(items)} do frontieru ({new} nových).")
+    if not in_memory:
+        ctx.storage.frontier_push(items)
+    return items
+
+
+def run_daemon(ctx: RunContext) -> int:
+    """
+    Dlho bežiaci režim: každý cieľ (novinky, zápasy, jednotlivé čerstvé články) má
+    vlastný interval, ktorý sa skracuje po zmene a predlžuje, keď sa nič nemení.
+    Počas zápasového okna sa novinky a zápasy kontrolujú častejšie.
+    """
+    cfg, args, storage, http, logger = ctx.cfg, ctx.args, ctx.storage, ctx.http, ctx.logger
+
+    window = GameWindow(cfg.DAEMON_GAME_BEFORE_S, cfg.DAEMON_GAME_AFTER_S)
+    sched = Scheduler(window, logger)
+    robots_cache = None if (args.record or args.replay) else RobotsCache(cfg.ROBOTS_CACHE_PATH, cfg.ROBOTS_CACHE_TTL)
+    last_matches: dict[str, tuple] = {}
+
+    def refresh_game_window() -> None:
+        window.set_match_times(storage.match_times((date.today() - timedelta(days=1)).isoformat()))
+
+    def novinky() -> bool:
+        items = run_novinky(ctx)
+        drain_frontier(ctx, items)
+        return bool(items)
+
+    def matches() -> bool:
+        res = run_matches(ctx)
+        if not res.allowed:
+            return False
+        drain_frontier(ctx, res.report_items, kinds=(KIND_MATCH_REPORT,))
+        hashes = (res.api_hash, res.html_hash)
+        changed = last_matches.get("hashes") != hashes
+        last_matches["hashes"] = hashes
+        if changed and not args.dry_run:
+            refresh_game_window()
+        return changed
+
+    def article_target(card: dict) -> Target:
+        url = card["url"]
+
+        def run() -> bool:
+            if not ctx.robots.can_fetch(url).allowed:
+                logger.warning(f"Preskakujem (robots): {url}")
+                sched.remove(f"article:{url}")
+                return False
+            res = http.get(url, conditional=True, extra_headers=HTML_HEADERS)
+            process_article(ctx, url, res, card)
+            return res.status_code == 200 and not res.unchanged
+
+        start, lo, hi, game = cfg.DAEMON_ARTICLE
+        # rozhodenie termínov, aby sa po štarte nestiahli všetky články naraz
+        return Target(f"article:{url}", run, start, lo, hi, game, next_due=time.time() + random.uniform(0, start))
+
+    def article_sync() -> bool:
+        since = (date.today() - timedelta(days=cfg.DAEMON_ARTICLE_RECRAWL_DAYS)).isoformat()
+        cards = {r["url"]: r for r in storage.recent_articles(since)}
+        current = {n.split(":", 1)[1] for n in sched.names("article:")}
+        for url in current - cards.keys():
+            sched.remove(f"article:{url}")
+        for url in cards.keys() - current:
+            sched.add(article_target(cards[url]))
+        logger.info(f"Daemon: sledovaných článkov {len(cards)} (+{len(cards.keys() - current)}, -{len(current - cards.keys())})")
+        return cards.keys() != current
+
+    def robots_refresh() -> bool:
+        text = robots_cache.load(http, cfg.ROBOTS_URL, logger)
+        if not text:
+            return False
+        ctx.robots.load(text, cfg.ROBOTS_URL)
+        apply_robots_rate(cfg, http, ctx.robots, logger)
+        return True
+
+    def on_tick() -> None:
+        # každý cieľ má vlastný rozpočet requestov; checkpoint DB + cache po každom cieli
+        # (najprv obnoviť spadnuté spojenie, inak flush zlyhá na mŕtvom spojení)
+        http.reset_request_count()
+        storage.ensure_alive()
+        checkpoint(ctx, force=True)
+        if http.response_cache is not None:
+            http.response_cache.save()
+
+    start, lo, hi, game = cfg.DAEMON_NOVINKY
+    sched.add(Target("novinky", novinky, start, lo, hi, game))
+    start, lo, hi, game = cfg.DAEMON_MATCHES
+    sched.add(Target("matches", matches, start, lo, hi, game))
+    sync = cfg.DAEMON_SYNC_INTERVAL
+    sched.add(Target("article_sync", article_sync, sync, sync, sync))
+    if robots_cache is not None:
+        sched.add(Target("robots", robots_refresh, sync, sync, sync, next_due=time.time() + sync))
+
+    refresh_game_window()
+
+    def _stop(signum, _frame) -> None:
+        logger.info(f"Daemon: signál {signum} – končím po aktuálnom cieli.")
+        sched.stop()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    logger.info(f"Daemon štartuje ({len(sched)} cieľov).")
+    sched.run_forever(on_tick=on_tick)
+    logger.info("Daemon zastavený.")
+    return 0
 
 
 def main() -> int:
@@ -112,214 +572,161 @@ def main() -> int:
     logger = setup_logging(cfg.LOG_DIR)
 
     ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "command",
+        nargs="?",
+        choices=("run", "daemon"),
+        default="run",
+        help="run = jeden beh (cron), daemon = priebežné sledovanie s adaptívnymi intervalmi.",
+    )
     ap.add_argument("--dry-run", action="store_true", help="Nevkladá do DB, iba vypíše, čo by uložil.")
     ap.add_argument("--novinky-limit", type=int, default=cfg.NOVINKY_LIMIT)
+    ap.add_argument("--backfill", action="store_true", help="Prejde celé stránkovanie noviniek (celá história).")
+    ap.add_argument("--max-pages", type=int, default=None, help="Max. strán /novinky (default podľa režimu).")
     ap.add_argument("--max-requests", type=int, default=cfg.MAX_REQUESTS_PER_RUN)
+    ap.add_argument("--concurrency", type=int, default=cfg.FETCH_CONCURRENCY, help="Max. súbežných requestov.")
+    ap.add_argument("--no-http-cache", action="store_true", help="Neukladá surové odpovede do lokálnej cache.")
+    ap.add_argument(
+        "--feeds",
+        default=None,
+        help="API zápasov ako liga:sezóna oddelené čiarkou (default MATCH_LEAGUES × CURRENT_SEASON, "
+        "pri --backfill MATCH_LEAGUES × posledných MATCH_BACKFILL_SEASONS sezón).",
+    )
+    ap.add_argument(
+        "--parser-backend",
+        choices=available_backends(),
+        default=None,
+        help="HTML parser (default lxml, ak je nainštalovaný cssselect, inak bs4).",
+    )
+    ap.add_argument(
+        "--parse-workers",
+        type=int,
+        default=cfg.PARSE_WORKERS,
+        help="Počet procesov na parsovanie (0 = v hlavnom procese; pre backfill/replay ~ počet jadier).",
+    )
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--record", type=Path, metavar="DIR", help="Nahrá všetky odpovede do adresára DIR.")
+    mode.add_argument(
+        "--replay",
+        type=Path,
+        metavar="DIR",
+        help="Offline beh nad nahrávkou z DIR (bez siete a bez čakania; vždy ako --dry-run).",
+    )
     args = ap.parse_args()
 
-    storage = Storage()
+    if args.parser_backend:
+        set_backend(args.parser_backend)
+
+    try:
+        if args.feeds:
+            feeds = parse_feeds(args.feeds)
+        elif args.backfill:
+            feeds = backfill_feeds(cfg.MATCH_LEAGUES, cfg.CURRENT_SEASON, cfg.MATCH_BACKFILL_SEASONS)
+        elif cfg.MATCH_FEEDS:
+            feeds = parse_feeds(cfg.MATCH_FEEDS)
+        else:
+            feeds = backfill_feeds(cfg.MATCH_LEAGUES, cfg.CURRENT_SEASON, 1)
+    except ValueError as e:
+        ap.error(str(e))
+    if not any(f.season == cfg.CURRENT_SEASON for f in feeds):
+        # reporty z HTML sa párujú iba k zápasom CURRENT_SEASON
+        logger.warning(f"Žiadny feed nie je zo sezóny {cfg.CURRENT_SEASON} – reporty zápasov sa nespárujú.")
+
+    # ešte pred otvorením DB – inak by chyba obišla storage.close() vo finally
+    if args.replay and not is_recording(args.replay):
+        ap.error(f"--replay: nahrávka neexistuje: {args.replay}")
+    # stará nahrávka by v DB prepísala čerstvé riadky (status, skóre) – replay do DB nezapisuje
+    if args.replay:
+        args.dry_run = True
+
+    storage = Storage(flush_rows=cfg.DB_FLUSH_ROWS, flush_seconds=cfg.DB_FLUSH_SECONDS)
     storage.init_schema()
+    storage.preload_meta()
+
+    response_cache = None
+    if not (args.no_http_cache or args.replay):
+        response_cache = ResponseCache(cfg.HTTP_CACHE_DIR, cfg.HTTP_CACHE_MAX_BYTES)
 
     http = HttpClient(
         user_agent=cfg.USER_AGENT,
         timeout=cfg.TIMEOUT,
-        min_sleep=cfg.MIN_SLEEP,
-        max_sleep=cfg.MAX_SLEEP,
-        max_retries=cfg.MAX_RETRIES,
+        # replay: žiadne čakanie ani retry – sieť sa nepoužíva
+        host_rps=0.0 if args.replay else cfg.HOST_RPS,
+        host_burst=cfg.HOST_BURST,
+        concurrency=args.concurrency,
+        max_retries=0 if args.replay else cfg.MAX_RETRIES,
         backoff_base=cfg.BACKOFF_BASE,
         backoff_jitter_min=cfg.BACKOFF_JITTER_MIN,
         backoff_jitter_max=cfg.BACKOFF_JITTER_MAX,
         max_requests_per_run=args.max_requests,
         storage_http_meta=storage,
         logger=logger,
+        response_cache=response_cache,
+        conditional_enabled=not (args.record or args.replay),
     )
 
+    recording = None
+    if args.record:
+        recording = install_recorder(http.session, args.record, **http.adapter_kwargs)
+        logger.info(f"RECORD: odpovede sa nahrávajú do {args.record}")
+    elif args.replay:
+        install_replay(http.session, args.replay, **http.adapter_kwargs)
+        logger.info(f"REPLAY: offline beh nad {args.replay}")
+
+    ctx: RunContext | None = None
     try:
         # --- ROBOTS ---
-        robots_text = fetch_robots_unconditional(cfg.ROBOTS_URL, cfg.USER_AGENT, int(cfg.TIMEOUT))
+        if args.record or args.replay:
+            # nahrávka musí robots.txt obsahovať – perzistentnú cache obchádzame
+            robots_res = fetch_robots(http, cfg.ROBOTS_URL)
+            robots_text = (robots_res.text or "").strip() if robots_res and robots_res.status_code == 200 else None
+        else:
+            robots_text = RobotsCache(cfg.ROBOTS_CACHE_PATH, cfg.ROBOTS_CACHE_TTL).load(http, cfg.ROBOTS_URL, logger)
         if not robots_text:
-            logger.error("robots.txt sa nepodarilo stiahnuť (unconditional) – končím.")
+            logger.error("robots.txt sa nepodarilo stiahnuť a nie je ani v cache – končím.")
             return 2
 
         robots = RobotsChecker(cfg.USER_AGENT)
         robots.load(robots_text, cfg.ROBOTS_URL)
-        logger.info("robots.txt načítaný a spracovaný (unconditional).")
+        logger.info("robots.txt načítaný a spracovaný.")
+
+        if not args.replay:
+            apply_robots_rate(cfg, http, robots, logger)
 
         # --- NOVINKY ---
         if not robots.can_fetch(cfg.NOVINKY_URL).allowed:
             logger.error(f"Zakázané robots.txt: {cfg.NOVINKY_URL}")
             return 3
 
-        status, novinky_html = fetch_html_unconditional(cfg.NOVINKY_URL, cfg.USER_AGENT, int(cfg.TIMEOUT))
-        if status != 200 or not novinky_html.strip():
-            logger.warning(f"Novinky list: bez obsahu alebo status={status} – preskakujem.")
-        else:
-            cards = parse_novinky_list(novinky_html, cfg.BASE_URL, limit=args.novinky_limit)
-            logger.info(f"Novinky: našla sa {len(cards)} kariet (limit {args.novinky_limit}).")
-
-            for c in cards:
-                url = c["url"]
-
-                rp = robots.can_fetch(url)
-                if not rp.allowed:
-                    logger.warning(f"Preskakujem (robots): {url}")
-                    continue
-
-                detail_res = http.get(url, extra_sleep=True, conditional=True)
-
-                if detail_res.status_code == 304:
-                    logger.info(f"Článok nezmenený (304): {url}")
-                    continue
-
-                if not detail_res.text:
-                    logger.warning(f"Článok bez obsahu: {url}")
-                    continue
-
-                atype = detect_article_type(detail_res.text)
-                if atype == "type1":
-                    parsed = parse_article_type1(detail_res.text, cfg.BASE_URL)
-                    parsed_date_text = c.get("date_text")
-                    parsed_date_iso = c.get("date_iso")
-                else:
-                    parsed = parse_article_type2(detail_res.text, cfg.BASE_URL)
-                    parsed_date_text = parsed.get("date_text") or c.get("date_text")
-                    parsed_date_iso = parsed.get("date_iso") or c.get("date_iso")
-
-                row = {
-                    "url": url,
-                    "type": parsed["type"],
-                    "title": parsed.get("title") or c.get("title"),
-                    "date_text": parsed_date_text,
-                    "date_iso": parsed_date_iso,
-                    "card_image_url": c.get("card_image_url"),
-                    "header_image_url": parsed.get("header_image_url"),
-                    "match_datetime_text": parsed.get("match_datetime_text"),
-                    "match_datetime_iso": parsed.get("match_datetime_iso"),
-                    "match_round": parsed.get("match_round"),
-                    "match_score": parsed.get("match_score"),
-                    "match_is_win": parsed.get("match_is_win"),
-                    "match_logo_home_url": parsed.get("match_logo_home_url"),
-                    "match_logo_away_url": parsed.get("match_logo_away_url"),
-                    "content_html": parsed.get("content_html") or "",
-                    "content_text": parsed.get("content_text") or "",
-                }
-
-                if args.dry_run:
-                    logger.info(f"[DRY-RUN] článok: {row['type']} | {row['title']} | {row['url']}")
-                else:
-                    inserted, updated = storage.upsert_article(row)
-                    if inserted:
-                        logger.info(f"INSERT článok: {row['title']} | {row['url']}")
-                    elif updated:
-                        logger.info(f"UPDATE článok: {row['title']} | {row['url']}")
-
-        # --- ZÁPASY ---
-        if not robots.can_fetch(cfg.ZAPASY_URL).allowed:
-            logger.error(f"Zakázané robots.txt: {cfg.ZAPASY_URL}")
-            return 4
-
-        # HTML (reporty)
-        html_res = http.get(cfg.ZAPASY_URL, extra_sleep=False, conditional=False)
-        html_text = (html_res.text or "").strip()
-
-        report_items = []
-        if html_res.status_code == 200 and html_text:
-            report_items = parse_match_reports(html_text, cfg.BASE_URL)
-        else:
-            logger.warning(f"Zápasy HTML: bez obsahu alebo status={html_res.status_code} – reporty preskakujem.")
-
-        # reports_map – uložíme viacero variantov kľúčov
-        reports_map: dict[str, str] = {}
-        for x in report_items or []:
-            ru = (x.get("report_url") or "").strip()
-            if not ru:
-                continue
-
-            for k in (
-                x.get("match_key"),
-                x.get("match_key_swapped"),
-                x.get("join_key"),
-                x.get("join_key_swapped"),
-            ):
-                kk = _normalize_key(k or "")
-                if kk:
-                    reports_map[kk] = ru
-
-        logger.info(f"Reporty: items={len(report_items)} | map={len(reports_map)}")
-        if report_items:
-            logger.info(f"Report sample item: {report_items[0]}")
-        if reports_map:
-            logger.info(f"Report sample keys: {list(reports_map.keys())[:5]}")
-
-        # API zápasy
-        api_headers = {
-            "Accept": "application/json, text/plain, */*",
-            "X-Requested-With": "XMLHttpRequest",
-            "Referer": cfg.ZAPASY_URL,
-            "Origin": cfg.BASE_URL,
-        }
-
-        api_res = http.get(
-            cfg.ZAPASY_API_URL,
-            extra_sleep=False,
-            conditional=False,
-            extra_headers=api_headers,
+        ctx = RunContext(
+            cfg=cfg,
+            args=args,
+            storage=storage,
+            http=http,
+            robots=robots,
+            logger=logger,
+            feeds=feeds,
+            parse_pool=ParsePool(args.parse_workers, args.parse_workers * cfg.PARSE_QUEUE_PER_WORKER),
         )
+        if args.command == "daemon":
+            return run_daemon(ctx)
 
-        json_text = (api_res.text or "").strip()
-        if api_res.status_code != 200 or not json_text:
-            logger.warning(f"Zápasy API: bez obsahu alebo status={api_res.status_code} – preskakujem.")
-        else:
-            matches = parse_matches_api_json(json_text)
-            logger.info(f"Zápasy: našlo sa {len(matches)} položiek (API).")
-            if matches:
-                logger.info(f"API sample match: {matches[0]}")
-
-            matched_reports = 0
-            debug_misses = 0
+        memory_items = run_novinky(ctx)
 
-            for m in matches:
-                mk_api = _normalize_key(m.get("match_key") or "")
+        # zápasy (HTML + 1 request na feed) idú pred frontierom – nesmie ich vytlačiť limit requestov
+        matches = run_matches(ctx)
+        memory_items += matches.report_items
 
-                # join key podľa dňa (bez času)
-                jk = _normalize_key(
-                    _join_key_day(m.get("date_iso"), m.get("round"), m.get("team_home"), m.get("team_away"))
-                )
-                jk_swapped = _normalize_key(
-                    _join_key_day(m.get("date_iso"), m.get("round"), m.get("team_away"), m.get("team_home"))
-                )
+        drain_frontier(ctx, memory_items)
 
-                report_url = (
-                    reports_map.get(mk_api)
-                    or reports_map.get(jk)
-                    or reports_map.get(jk_swapped)
-                )
-
-                if report_url:
-                    matched_reports += 1
-                    m["report_url"] = report_url
-                else:
-                    m["report_url"] = None
-                    if debug_misses < 5:
-                        debug_misses += 1
-                        logger.info(
-                            "MISS report join | "
-                            f"mk_api='{mk_api}' | jk='{jk}' | jk_swapped='{jk_swapped}'"
-                        )
-
-                if args.dry_run:
-                    logger.info(
-                        "[DRY-RUN] zápas: "
-                        f"{m.get('status')} | {m.get('team_home')} vs {m.get('team_away')} | "
-                        f"{m.get('date_text')} | report={bool(m.get('report_url'))}"
-                    )
-                else:
-                    storage.upsert_match(m)
-
-            logger.info(f"Reporty spárované k zápasom: {matched_reports}/{len(matches)}")
-
-        logger.info(f"Hotovo. Requesty v tomto behu: {http.request_count}")
-        return 0
+        hs = http.stats
+        logger.info(
+            f"Hotovo. Requesty v tomto behu: {http.request_count} | "
+            f"čakanie na rate limit: {http.rate_wait_seconds:.1f}s | "
+            f"prenesené {hs.wire_bytes / 1024:.0f} kB (telá {hs.body_bytes / 1024:.0f} kB) | "
+            f"priem. latencia {1000 * hs.elapsed / max(1, hs.responses):.0f} ms"
+        )
+        return 0 if matches.allowed else 4
 
     except RequestLimitExceeded as e:
         logger.error(f"STOP – {e}")
@@ -328,7 +735,25 @@ def main() -> int:
         logger.exception(f"Neočakávaná chyba: {e}")
         return 11
     finally:
-        storage.close()
+        # záverečný checkpoint – aj pri limite requestov / chybe sa dopíše, čo je v bufferi
+        try:
+            if ctx is not None:
+                checkpoint(ctx, force=True)
+        except Exception as e:
+            logger.warning(f"DB checkpoint zlyhal: {e}")
+        if ctx is not None:
+            ctx.parse_pool.close()
+        for cache in (response_cache, recording):
+            if cache is None:
+                continue
+            try:
+                cache.save()
+            except OSError as e:
+                logger.warning(f"HTTP cache index sa nepodarilo uložiť: {e}")
+        try:
+            storage.close()  # flush zvyšku (napr. http_meta z robots.txt) + zatvorenie
+        except Exception as e:
+            logger.warning(f"DB flush pri zatváraní zlyhal: {e}")
 
 
 if __name__ == "__main__":
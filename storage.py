@@ -1,20 +1,51 @@
 # storage.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_values
 
 from db import build_postgres_url
 
+# stĺpce articles okrem kľúča (url) a časových značiek – porovnávajú sa pri UPSERT-e
+_ARTICLE_COLS = (
+    "type", "title", "date_text", "date_iso", "card_image_url", "header_image_url",
+    "match_datetime_text", "match_datetime_iso", "match_round", "match_score", "match_is_win",
+    "match_logo_home_url", "match_logo_away_url",
+    "content_html", "content_text",
+)
+# pretypovanie hodnôt vo VALUES – stĺpec so samými NULL by inak bol text
+_ARTICLE_CASTS = {"match_is_win": "integer"}
+
 
 @dataclass
 class StorageStats:
     articles_inserted: int = 0
     articles_updated: int = 0
+    articles_unchanged: int = 0
     matches_upserted: int = 0
+    reports_upserted: int = 0
+    meta_flushed: int = 0
+    checkpoints: int = 0
+
+
+@dataclass
+class FlushResult:
+    """
+    Čo zapísal jeden checkpoint (flush) write-behind bufferu.
+    """
+
+    articles: dict[str, str] = field(default_factory=dict)  # url -> insert / update / same
+    reports: dict[str, str] = field(default_factory=dict)  # match_key -> insert / update
+    frontier_done: int = 0
+    meta: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.articles or self.reports or self.frontier_done or self.meta)
 
 
 class Storage:
@@ -23,10 +54,32 @@ class Storage:
     Používa jedno spojenie na celý beh scraperu.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, flush_rows: int = 50, flush_seconds: float = 30.0) -> None:
         self.db_url = build_postgres_url()
+        self.conn = self._connect()
 
-        self.conn = psycopg2.connect(
+        self.stats = StorageStats()
+
+        # http_meta: in-memory cache (preload_meta) + write-behind (zapíše ho checkpoint flush)
+        self._meta_cache: dict[str, dict[str, Any]] | None = None
+        self._meta_dirty: dict[str, dict[str, Any]] = {}
+        # get_meta/upsert_meta volajú aj vlákna HttpClient.get_many súbežne s checkpointom
+        self._meta_lock = threading.Lock()
+        self._meta_flushing: dict[str, dict[str, Any]] = {}
+
+        # write-behind buffer článkov, reportov a hotových položiek frontieru – do DB idú
+        # spolu s http_meta v jednej transakcii (checkpoint) každých flush_rows riadkov
+        # alebo flush_seconds sekúnd; pád behu stratí najviac jeden neuložený batch
+        # (jeho URL ostanú vo frontieri a meta sa nezapíše, takže sa stiahnu znova)
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._pending_articles: dict[str, dict[str, Any]] = {}
+        self._pending_reports: dict[str, dict[str, Any]] = {}
+        self._pending_done: set[str] = set()
+        self._last_flush = time.monotonic()
+
+    def _connect(self):
+        conn = psycopg2.connect(
             self.db_url,
             cursor_factory=RealDictCursor,
             connect_timeout=10,
@@ -36,11 +89,40 @@ class Storage:
             keepalives_count=3,
             sslmode="require",
         )
-        self.conn.autocommit = False
+        conn.autocommit = False
+        return conn
 
-        self.stats = StorageStats()
+    def ensure_alive(self) -> None:
+        """
+        Pre dlho bežiaci daemon: ak DB spojenie medzitým spadlo, otvorí nové.
+        """
+        try:
+            if not self.conn.closed:
+                with self.conn.cursor() as cur:
+                    cur.execute("SELECT 1;")
+                self.conn.rollback()
+                return
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            pass
+        # bez flushu – buffer ostáva v pamäti a zapíše sa cez nové spojenie
+        self._close_conn()
+        self.conn = self._connect()
 
     def close(self) -> None:
+        """
+        Záverečný checkpoint (flush) a zatvorenie spojenia. Chyba flushu sa po zatvorení prepošle ďalej.
+        """
+        error = None
+        try:
+            if self.conn and not self.conn.closed:
+                self.flush()
+        except Exception as e:
+            error = e
+        self._close_conn()
+        if error is not None:
+            raise error
+
+    def _close_conn(self) -> None:
         try:
             if self.conn and not self.conn.closed:
                 try:
@@ -78,6 +160,8 @@ class Storage:
             );
             """
             )
+            # sha256 tela odpovede – zmena obsahu aj bez ETag/Last-Modified
+            cur.execute("ALTER TABLE http_meta ADD COLUMN IF NOT EXISTS content_hash TEXT;")
 
             cur.execute(
                 """
@@ -133,6 +217,49 @@ class Storage:
             """
             )
 
+            # súťaž + sezóna (API feed), z ktorého zápas pochádza
+            cur.execute("ALTER TABLE matches ADD COLUMN IF NOT EXISTS league TEXT;")
+            cur.execute("ALTER TABLE matches ADD COLUMN IF NOT EXISTS season TEXT;")
+
+            # detail reportu zápasu (parsers/zapasy_report_detail)
+            cur.execute(
+                """
+            CREATE TABLE IF NOT EXISTS match_reports (
+                match_key TEXT PRIMARY KEY,
+                report_url TEXT NOT NULL,
+                title TEXT,
+                content_html TEXT,
+                content_text TEXT,
+
+                last_seen_at TIMESTAMPTZ DEFAULT now(),
+                updated_at TIMESTAMPTZ DEFAULT now()
+            );
+            """
+            )
+            cur.execute("CREATE INDEX IF NOT EXISTS match_reports_url_idx ON match_reports (report_url);")
+
+            # perzistentný frontier – čo ešte treba stiahnuť (prežije prerušený beh)
+            cur.execute(
+                """
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL, -- article / match_report
+                priority INTEGER NOT NULL DEFAULT 0,
+                next_due_at TIMESTAMPTZ DEFAULT now(), -- NULL = odstavené (veľa neúspechov)
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_status INTEGER,
+                payload JSONB,
+
+                created_at TIMESTAMPTZ DEFAULT now(),
+                updated_at TIMESTAMPTZ DEFAULT now()
+            );
+            """
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS frontier_due_idx ON frontier (priority DESC, next_due_at) "
+                "WHERE next_due_at IS NOT NULL;"
+            )
+
             cur.execute(
                 """
             CREATE TABLE IF NOT EXISTS runs (
@@ -148,123 +275,286 @@ class Storage:
         self._commit()
 
     # --- http_meta ---
+    def preload_meta(self, urls: Iterable[str] | None = None) -> int:
+        """
+        Načíta http_meta naraz do pamäte (1 query namiesto SELECT-u pre každú URL).
+        Bez `urls` načíta celú tabuľku. Vracia počet načítaných riadkov.
+        """
+        with self.conn.cursor() as cur:
+            if urls is None:
+                cur.execute("SELECT url, etag, last_modified, content_hash FROM http_meta")
+            else:
+                cur.execute(
+                    "SELECT url, etag, last_modified, content_hash FROM http_meta WHERE url = ANY(%s)",
+                    (list(urls),),
+                )
+            rows = cur.fetchall()
+        self._commit()
+
+        with self._meta_lock:
+            if self._meta_cache is None:
+                self._meta_cache = {}
+            for r in rows:
+                self._meta_cache[r["url"]] = dict(r)
+        return len(rows)
+
     def get_meta(self, url: str) -> Optional[dict[str, Any]]:
+        with self._meta_lock:
+            row = self._meta_dirty.get(url)
+            if row is None and self._meta_cache is not None:
+                row = self._meta_cache.get(url)
+                return dict(row) if row else None
+        if row is not None:
+            return dict(row)
+
         with self.conn.cursor() as cur:
-            cur.execute("SELECT url, etag, last_modified FROM http_meta WHERE url = %s", (url,))
+            cur.execute("SELECT url, etag, last_modified, content_hash FROM http_meta WHERE url = %s", (url,))
             row = cur.fetchone()
             return dict(row) if row else None
 
-    def upsert_meta(self, url: str, etag: str | None, last_modified: str | None) -> None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-            INSERT INTO http_meta (url, etag, last_modified, updated_at)
-            VALUES (%s, %s, %s, now())
+    def upsert_meta(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str | None = None,
+    ) -> None:
+        """
+        Write-behind: zmena sa iba zapamätá, do DB ide až vo flush().
+        Nezmenené ETag/Last-Modified/content_hash sa neprepisujú vôbec.
+        """
+        row = {"url": url, "etag": etag, "last_modified": last_modified, "content_hash": content_hash}
+        with self._meta_lock:
+            current = self._meta_dirty.get(url) or (self._meta_cache or {}).get(url)
+            if current and all(current.get(k) == row[k] for k in ("etag", "last_modified", "content_hash")):
+                return
+
+            self._meta_dirty[url] = row
+            if self._meta_cache is not None:
+                self._meta_cache[url] = row
+
+    def _write_meta(self, cur) -> int:
+        # snapshot pod zámkom – zmeny z iných vlákien počas zápisu ostanú v _meta_dirty na ďalší flush
+        with self._meta_lock:
+            self._meta_flushing = dict(self._meta_dirty)
+        rows = [
+            (r["url"], r["etag"], r["last_modified"], r.get("content_hash"))
+            for r in self._meta_flushing.values()
+        ]
+        if not rows:
+            return 0
+        execute_values(
+            cur,
+            """
+            INSERT INTO http_meta (url, etag, last_modified, content_hash, updated_at)
+            VALUES %s
             ON CONFLICT (url) DO UPDATE SET
                 etag = EXCLUDED.etag,
                 last_modified = EXCLUDED.last_modified,
+                content_hash = EXCLUDED.content_hash,
                 updated_at = now();
-            """
-                ,
-                (url, etag, last_modified),
-            )
+            """,
+            rows,
+            template="(%s, %s, %s, %s, now())",
+            page_size=500,
+        )
+        return len(rows)
+
+    def _meta_written(self, count: int) -> None:
+        with self._meta_lock:
+            for url, row in self._meta_flushing.items():
+                if self._meta_dirty.get(url) is row:
+                    del self._meta_dirty[url]
+            self._meta_flushing = {}
+        self.stats.meta_flushed += count
+
+    # --- write-behind buffer ---
+    def buffer_article(self, data: dict[str, Any]) -> None:
+        self._pending_articles[data["url"]] = data
+
+    def buffer_match_report(self, data: dict[str, Any]) -> None:
+        self._pending_reports[data["match_key"]] = data
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending_articles) + len(self._pending_reports) + len(self._pending_done)
+
+    def flush_due(self) -> bool:
+        if not self.pending:
+            return False
+        return self.pending >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_seconds
+
+    def flush_if_due(self) -> FlushResult:
+        return self.flush() if self.flush_due() else FlushResult()
+
+    def flush(self) -> FlushResult:
+        """
+        Checkpoint: články, reporty, hotové položky frontieru a http_meta v jednej transakcii.
+        Pri chybe sa transakcia vráti a buffer ostane na ďalší pokus.
+        """
+        self._last_flush = time.monotonic()
+        res = FlushResult()
+        if not self.pending and not self._meta_dirty:
+            return res
+
+        try:
+            with self.conn.cursor() as cur:
+                res.articles = self._write_articles(cur, list(self._pending_articles.values()))
+                res.reports = self._write_match_reports(cur, list(self._pending_reports.values()))
+                if self._pending_done:
+                    cur.execute("DELETE FROM frontier WHERE url = ANY(%s)", (list(self._pending_done),))
+                res.frontier_done = len(self._pending_done)
+                res.meta = self._write_meta(cur)
+        except Exception:
+            try:
+                self.conn.rollback()
+            except Exception:
+                pass
+            raise
         self._commit()
 
-    # --- articles ---
-    def article_exists(self, url: str) -> bool:
-        with self.conn.cursor() as cur:
-            cur.execute("SELECT 1 FROM articles WHERE url = %s LIMIT 1", (url,))
-            return cur.fetchone() is not None
+        self._pending_articles.clear()
+        self._pending_reports.clear()
+        self._pending_done.clear()
+        self._meta_written(res.meta)
+        self._count_articles(res.articles)
+        self.stats.reports_upserted += len(res.reports)
+        self.stats.checkpoints += 1
+        return res
 
-    def upsert_article(self, data: dict[str, Any]) -> tuple[bool, bool]:
+    # --- articles ---
+    def known_article_urls(self, urls: Iterable[str]) -> set[str]:
         """
-        Returns (inserted, updated)
+        Ktoré z daných URL už v articles sú – jedna query pre celú stránku kariet.
         """
+        urls = list(urls)
+        if not urls:
+            return set()
         with self.conn.cursor() as cur:
-            cur.execute("SELECT url FROM articles WHERE url = %s", (data["url"],))
-            existing = cur.fetchone()
+            cur.execute("SELECT url FROM articles WHERE url = ANY(%s)", (urls,))
+            return {r["url"] for r in cur.fetchall()}
 
-            if not existing:
-                cur.execute(
-                    """
-                INSERT INTO articles (
-                  url, type, title, date_text, date_iso, card_image_url, header_image_url,
-                  match_datetime_text, match_datetime_iso, match_round, match_score, match_is_win,
-                  match_logo_home_url, match_logo_away_url,
-                  content_html, content_text,
-                  last_seen_at, updated_at
-                ) VALUES (
-                  %(url)s, %(type)s, %(title)s, %(date_text)s, %(date_iso)s, %(card_image_url)s, %(header_image_url)s,
-                  %(match_datetime_text)s, %(match_datetime_iso)s, %(match_round)s, %(match_score)s, %(match_is_win)s,
-                  %(match_logo_home_url)s, %(match_logo_away_url)s,
-                  %(content_html)s, %(content_text)s,
-                  now(), now()
-                );
-                """,
-                    data,
-                )
-                self._commit()
+    def _write_articles(self, cur, rows: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Jeden príkaz pre všetky riadky (bez commitu). Vracia url -> insert / update / same.
+        """
+        if not rows:
+            return {}
+        cols = ", ".join(_ARTICLE_COLS)
+        excluded = ", ".join(f"EXCLUDED.{c}" for c in _ARTICLE_COLS)
+        template = "(%(url)s, " + ", ".join(
+            f"%({c})s::{_ARTICLE_CASTS.get(c, 'text')}" for c in _ARTICLE_COLS
+        ) + ")"
+        returned = execute_values(
+            cur,
+            f"""
+            WITH v (url, {cols}) AS (VALUES %s),
+            up AS (
+              INSERT INTO articles (url, {cols}, last_seen_at, updated_at)
+              SELECT url, {cols}, now(), now() FROM v
+              ON CONFLICT (url) DO UPDATE SET
+                ({cols}, last_seen_at, updated_at) = ({excluded}, now(), now())
+              WHERE ({", ".join(f"articles.{c}" for c in _ARTICLE_COLS)}) IS DISTINCT FROM ({excluded})
+              RETURNING url, (xmax = 0) AS inserted
+            ),
+            seen AS (
+              UPDATE articles a SET last_seen_at = now()
+              FROM v
+              WHERE a.url = v.url AND v.url NOT IN (SELECT url FROM up)
+            )
+            SELECT url, inserted FROM up;
+            """,
+            list({r["url"]: r for r in rows}.values()),
+            template=template,
+            page_size=1000,
+            fetch=True,
+        )
+        status = {r["url"]: "same" for r in rows}
+        for r in returned:
+            status[r["url"]] = "insert" if r["inserted"] else "update"
+        return status
+
+    def _count_articles(self, status: dict[str, str]) -> None:
+        for outcome in status.values():
+            if outcome == "insert":
                 self.stats.articles_inserted += 1
-                return True, False
+            elif outcome == "update":
+                self.stats.articles_updated += 1
+            else:
+                self.stats.articles_unchanged += 1
 
+    def recent_articles(self, since_date: str) -> list[dict[str, Any]]:
+        """
+        Články s date_iso >= since_date (YYYY-MM-DD) – polia karty potrebné na re-crawl.
+        """
+        with self.conn.cursor() as cur:
             cur.execute(
                 """
-            UPDATE articles SET
-              type = %(type)s,
-              title = %(title)s,
-              date_text = %(date_text)s,
-              date_iso = %(date_iso)s,
-              card_image_url = %(card_image_url)s,
-              header_image_url = %(header_image_url)s,
-
-              match_datetime_text = %(match_datetime_text)s,
-              match_datetime_iso = %(match_datetime_iso)s,
-              match_round = %(match_round)s,
-              match_score = %(match_score)s,
-              match_is_win = %(match_is_win)s,
-              match_logo_home_url = %(match_logo_home_url)s,
-              match_logo_away_url = %(match_logo_away_url)s,
-
-              content_html = %(content_html)s,
-              content_text = %(content_text)s,
-              last_seen_at = now(),
-              updated_at = now()
-            WHERE url = %(url)s;
-            """,
-                data,
+                SELECT url, title, date_text, date_iso, card_image_url
+                FROM articles
+                WHERE date_iso >= %s
+                ORDER BY date_iso DESC
+                """,
+                (since_date,),
             )
-
+            rows = [dict(r) for r in cur.fetchall()]
         self._commit()
-        self.stats.articles_updated += 1
-        return False, True
+        return rows
 
     # --- matches ---
+    def match_times(self, since_date: str) -> list[str]:
+        """
+        date_iso zápasov od since_date (YYYY-MM-DD) – pre zápasové okná daemonu.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT date_iso FROM matches WHERE date_iso >= %s ORDER BY date_iso",
+                (since_date,),
+            )
+            rows = [r["date_iso"] for r in cur.fetchall()]
+        self._commit()
+        return rows
+
     def upsert_match(self, data: dict[str, Any]) -> tuple[bool, bool]:
         """
-        UPSERT match podľa match_key.
+        UPSERT jedného zápasu podľa match_key (pozri upsert_matches).
         Returns (inserted, updated)
+        """
+        return self.upsert_matches([data])[0]
+
+    def upsert_matches(self, rows: Iterable[dict[str, Any]]) -> list[tuple[bool, bool]]:
+        """
+        UPSERT zápasov podľa match_key – jeden INSERT ... VALUES ... ON CONFLICT
+        a jeden commit pre celý zoznam (napr. všetky sezóny backfillu).
+        Returns [(inserted, updated), …] v poradí vstupu.
 
         Poznámka: match_key musí byť stabilný (bez statusu), inak vznikajú duplicity.
         """
-        # aby nezlyhalo, keď report_url nie je v dict-e (napr. starý kód)
-        if "report_url" not in data:
-            data = dict(data)
-            data["report_url"] = None
+        rows = list(rows)
+        if not rows:
+            return []
+
+        # ON CONFLICT nezvládne ten istý kľúč dvakrát v jednom príkaze – vyhráva posledný
+        # výskyt, report_url/league/season sa ako pri COALESCE nezmažú neskorším None
+        by_key: dict[str, dict[str, Any]] = {}
+        for data in rows:
+            prev = by_key.get(data["match_key"])
+            merged = dict(data)
+            # aby nezlyhalo, keď report_url/league/season nie sú v dict-e (napr. starý kód)
+            for k in ("report_url", "league", "season"):
+                merged[k] = data.get(k) if data.get(k) is not None else (prev or {}).get(k)
+            by_key[data["match_key"]] = merged
 
         with self.conn.cursor() as cur:
-            cur.execute(
+            returned = execute_values(
+                cur,
                 """
                 INSERT INTO matches (
                   match_key, status, date_text, date_iso, round, venue,
                   team_home, team_away, logo_home_url, logo_away_url,
-                  score, is_win, score_periods, report_url,
+                  score, is_win, score_periods, report_url, league, season,
                   last_seen_at, updated_at
-                ) VALUES (
-                  %(match_key)s, %(status)s, %(date_text)s, %(date_iso)s, %(round)s, %(venue)s,
-                  %(team_home)s, %(team_away)s, %(logo_home_url)s, %(logo_away_url)s,
-                  %(score)s, %(is_win)s, %(score_periods)s, %(report_url)s,
-                  now(), now()
-                )
+                ) VALUES %s
                 ON CONFLICT (match_key) DO UPDATE SET
                   status = EXCLUDED.status,
                   date_text = EXCLUDED.date_text,
@@ -281,18 +571,160 @@ class Storage:
 
                   -- neprepisuj existujúci report_url na NULL
                   report_url = COALESCE(EXCLUDED.report_url, matches.report_url),
+                  league = COALESCE(EXCLUDED.league, matches.league),
+                  season = COALESCE(EXCLUDED.season, matches.season),
 
                   last_seen_at = now(),
                   updated_at = now()
-                RETURNING (xmax = 0) AS inserted;
+                RETURNING match_key, (xmax = 0) AS inserted;
                 """,
-                data,
+                list(by_key.values()),
+                template="""(
+                  %(match_key)s, %(status)s, %(date_text)s, %(date_iso)s, %(round)s, %(venue)s,
+                  %(team_home)s, %(team_away)s, %(logo_home_url)s, %(logo_away_url)s,
+                  %(score)s, %(is_win)s, %(score_periods)s, %(report_url)s, %(league)s, %(season)s,
+                  now(), now()
+                )""",
+                page_size=1000,
+                fetch=True,
             )
 
-            row = cur.fetchone()
-            inserted = bool(row["inserted"]) if row and "inserted" in row else False
+        self._commit()
+
+        # RETURNING negarantuje poradie – párujeme podľa match_key
+        inserted = {r["match_key"]: bool(r["inserted"]) for r in returned}
+        self.stats.matches_upserted += len(by_key)
+        return [(inserted.get(d["match_key"], False), not inserted.get(d["match_key"], False)) for d in rows]
 
+    # --- match_reports ---
+    def known_report_urls(self, urls: Iterable[str]) -> set[str]:
+        """
+        Ktoré z report URL už majú uložený detail (1 query pre celý zoznam).
+        """
+        urls = list({u for u in urls if u})
+        if not urls:
+            return set()
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT DISTINCT report_url FROM match_reports WHERE report_url = ANY(%s)", (urls,))
+            found = {r["report_url"] for r in cur.fetchall()}
+        self._commit()
+        return found
+
+    def _write_match_reports(self, cur, rows: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Jeden príkaz pre všetky riadky (bez commitu). Vracia match_key -> insert / update.
+        """
+        if not rows:
+            return {}
+        returned = execute_values(
+            cur,
+            """
+            INSERT INTO match_reports (
+              match_key, report_url, title, content_html, content_text, last_seen_at, updated_at
+            ) VALUES %s
+            ON CONFLICT (match_key) DO UPDATE SET
+              report_url = EXCLUDED.report_url,
+              title = EXCLUDED.title,
+              content_html = EXCLUDED.content_html,
+              content_text = EXCLUDED.content_text,
+              last_seen_at = now(),
+              updated_at = now()
+            RETURNING match_key, (xmax = 0) AS inserted;
+            """,
+            list({r["match_key"]: r for r in rows}.values()),
+            template="(%(match_key)s, %(report_url)s, %(title)s, %(content_html)s, %(content_text)s, now(), now())",
+            page_size=1000,
+            fetch=True,
+        )
+        return {r["match_key"]: "insert" if r["inserted"] else "update" for r in returned}
+
+    # --- frontier ---
+    def frontier_push(self, items: Iterable[dict[str, Any]]) -> int:
+        """
+        Zaradí URL do frontieru (url, kind, priority, payload).
+        Už zaradené URL si nechajú termín aj pokusy, priorita sa iba zvýši.
+        """
+        rows = {}
+        for it in items:
+            payload = it.get("payload")
+            rows[it["url"]] = (
+                it["url"],
+                it["kind"],
+                int(it.get("priority") or 0),
+                Json(payload) if payload is not None else None,
+            )
+        if not rows:
+            return 0
+        # znova zaradená URL nesmie zmiznúť pri checkpointe staršieho "hotovo"
+        self._pending_done.difference_update(rows)
+
+        with self.conn.cursor() as cur:
+            execute_values(
+                cur,
+                """
+                INSERT INTO frontier (url, kind, priority, payload, next_due_at, created_at, updated_at)
+                VALUES %s
+                ON CONFLICT (url) DO UPDATE SET
+                  priority = GREATEST(frontier.priority, EXCLUDED.priority),
+                  payload = COALESCE(EXCLUDED.payload, frontier.payload),
+                  updated_at = now();
+                """,
+                list(rows.values()),
+                template="(%s, %s, %s, %s, now(), now(), now())",
+                page_size=500,
+            )
+        self._commit()
+        return len(rows)
+
+    def frontier_due(self, limit: int, kinds: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """
+        Splatné položky frontieru v poradí priority (potom najstaršie termíny).
+        """
+        sql = """
+            SELECT url, kind, priority, attempts, last_status, payload
+            FROM frontier
+            WHERE next_due_at IS NOT NULL AND next_due_at <= now()
+        """
+        params: list[Any] = []
+        if kinds is not None:
+            sql += " AND kind = ANY(%s)"
+            params.append(list(kinds))
+        if self._pending_done:
+            # hotové, ale ešte nezapísané (čakajú na checkpoint)
+            sql += " AND NOT (url = ANY(%s))"
+            params.append(list(self._pending_done))
+        sql += " ORDER BY priority DESC, next_due_at ASC LIMIT %s"
+        params.append(limit)
+
+        with self.conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = [dict(r) for r in cur.fetchall()]
         self._commit()
+        return rows
+
+    def frontier_done(self, url: str) -> None:
+        """
+        Položka je hotová – z frontieru zmizne pri najbližšom checkpointe spolu s jej riadkom.
+        """
+        self._pending_done.add(url)
 
-        self.stats.matches_upserted += 1
-        return inserted, (not inserted)
+    def frontier_failed(self, url: str, status: int | None, retry_in_s: float, max_attempts: int) -> None:
+        """
+        Neúspešný pokus: posunie termín (backoff), po `max_attempts` položku odstaví (next_due_at = NULL).
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE frontier SET
+                  attempts = attempts + 1,
+                  last_status = %s,
+                  next_due_at = CASE
+                    WHEN attempts + 1 >= %s THEN NULL
+                    ELSE now() + make_interval(secs => %s)
+                  END,
+                  updated_at = now()
+                WHERE url = %s;
+                """,
+                (status, max_attempts, retry_in_s, url),
+            )
+        self._commit()
@@ -1,15 +1,84 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
+
 from dateutil import parser as dateparser
 
+# Formáty, ktoré hckosice.sk reálne používa – riešia sa bez dateutil:
+#   "25.11.2025", "utorok 25.11.2025, 18:00", "PRIDANÉ: 24. 11. 2025", "18.11.2025 o 18:30 hod."
+#   "25. novembra 2025", "25. november 2025 18:00"
+# Pred a za dátumom smie byť iba text bez číslic (deň v týždni, "PRIDANÉ:", "hod." …),
+# inak rozhoduje dateutil ako doteraz.
+_TIME = r"(?:[^\d]{0,6}?(\d{1,2}):(\d{2})(?::(\d{2}))?)?"
+_NUMERIC_RE = re.compile(r"^[^\d]*?(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})" + _TIME + r"[^\d]*$")
+_MONTH_NAME_RE = re.compile(r"^[^\d]*?(\d{1,2})\.\s*([^\W\d_]+)\.?\s+(\d{4})" + _TIME + r"[^\d]*$")
+
+_SK_MONTHS = {
+    name: i + 1
+    for i, forms in enumerate(
+        [
+            ("január", "januára", "jan"),
+            ("február", "februára", "feb"),
+            ("marec", "marca", "mar"),
+            ("apríl", "apríla", "apr"),
+            ("máj", "mája"),
+            ("jún", "júna"),
+            ("júl", "júla"),
+            ("august", "augusta", "aug"),
+            ("september", "septembra", "sep", "sept"),
+            ("október", "októbra", "okt"),
+            ("november", "novembra", "nov"),
+            ("december", "decembra", "dec"),
+        ]
+    )
+    for name in forms
+}
+
+
+def _fast_parse(value: str) -> str | None | bool:
+    """
+    Vracia ISO string, None (formát sedí, ale dátum je neplatný) alebo False (treba dateutil).
+    """
+    m = _NUMERIC_RE.match(value)
+    if m:
+        day, month = int(m.group(1)), int(m.group(2))
+    else:
+        m = _MONTH_NAME_RE.match(value)
+        if not m:
+            return False
+        month = _SK_MONTHS.get(m.group(2).lower())
+        if month is None:
+            return False
+        day = int(m.group(1))
+
+    try:
+        dt = datetime(
+            int(m.group(3)),
+            month,
+            day,
+            int(m.group(4) or 0),
+            int(m.group(5) or 0),
+            int(m.group(6) or 0),
+        )
+    except ValueError:
+        return None
+    return dt.isoformat()
+
+
+@lru_cache(maxsize=4096)
 def parse_datetime_safe(value: str) -> str | None:
     """
     Pokúsi sa parsovať dátum/čas do ISO 8601.
     Vracia ISO string alebo None.
+    Rovnaké reťazce sa na stránke opakujú, preto je výsledok cachovaný (LRU).
     """
     if not value:
         return None
+    fast = _fast_parse(value)
+    if fast is not False:
+        return fast
     try:
         dt = dateparser.parse(value, dayfirst=True, fuzzy=True)
         if not dt:
@@ -24,5 +93,5 @@ def normalize_added_date(text: str) -> str | None:
     """
     if not text:
         return None
-    # necháme dateutil spraviť fuzzy parsing
+    # rýchla cesta + fallback na fuzzy dateutil
     return parse_datetime_safe(text)
@@ -14,33 +14,48 @@ def absolutize(base_url: str, maybe_relative: str) -> str:
         return base_url.rstrip("/") + maybe_relative
     return base_url.rstrip("/") + "/" + maybe_relative
 
-def extract_img_url_from_node(base_url: str, node) -> str | None:
+def img_src_from_node(node) -> str | None:
     """
-    Skúsi nájsť img src, inak background-image v style atribúte.
+    Skúsi nájsť img src, inak background-image v style atribúte (bez absolutizácie).
     """
     if not node:
         return None
 
     img = node.find("img")
     if img and img.get("src"):
-        return absolutize(base_url, img["src"])
+        return img.get("src")
 
     style = node.get("style") or ""
     m = _BG_RE.search(style)
     if m:
-        return absolutize(base_url, m.group(2))
+        return m.group(2)
 
     return None
 
+def extract_img_url_from_node(base_url: str, node) -> str | None:
+    src = img_src_from_node(node)
+    return absolutize(base_url, src) if src is not None else None
+
 def inner_html(node) -> str:
     if not node:
         return ""
-    return "".join(str(x) for x in node.contents)
+    return node.inner_html()
 
-def clean_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html or "", "lxml")
-    text = soup.get_text("\n", strip=True)
+def _clean_lines(text: str) -> str:
     # jemné upratanie prázdnych riadkov
     lines = [ln.strip() for ln in text.splitlines()]
     lines = [ln for ln in lines if ln]
     return "\n".join(lines)
+
+def clean_text_from_html(html: str) -> str:
+    soup = BeautifulSoup(html or "", "lxml")
+    return _clean_lines(soup.get_text("\n", strip=True))
+
+def text_from_node(node) -> str:
+    """
+    Ten istý text ako clean_text_from_html(inner_html(node)), ale priamo z už
+    sparsovaného uzla – bez serializácie a druhého parsovania.
+    """
+    if not node:
+        return ""
+    return _clean_lines(node.get_text("\n", strip=True))
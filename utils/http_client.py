@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from utils.rate_limit import HostRateLimiter
+from utils.response_cache import body_hash
+
+HTML_HEADERS = {"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"}
 
 
 @dataclass
@@ -14,6 +23,19 @@ class HttpResult:
     status_code: int
     text: str | None
     headers: dict
+    body_hash: str | None = None
+    # True = telo je bajtovo rovnaké ako pri poslednom zapamätanom stiahnutí (http_meta.content_hash)
+    unchanged: bool = False
+    elapsed: float = 0.0  # s, celý request vrátane stiahnutia tela
+    wire_bytes: int = 0  # prenesené (komprimované) bajty tela
+
+
+@dataclass
+class HttpStats:
+    responses: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    elapsed: float = 0.0
 
 
 class RequestLimitExceeded(Exception):
@@ -25,8 +47,9 @@ class HttpClient:
         self,
         user_agent: str,
         timeout: float,
-        min_sleep: float,
-        max_sleep: float,
+        host_rps: float,
+        host_burst: float,
+        concurrency: int,
         max_retries: int,
         backoff_base: float,
         backoff_jitter_min: float,
@@ -34,17 +57,26 @@ class HttpClient:
         max_requests_per_run: int,
         storage_http_meta,
         logger,
+        response_cache=None,
+        conditional_enabled: bool = True,
     ) -> None:
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": user_agent,
                 "Accept-Language": "sk,en;q=0.8",
+                # gzip vždy, br iba ak je nainštalovaný brotli (urllib3 ho potom vie dekódovať)
+                "Accept-Encoding": ACCEPT_ENCODING.replace(",", ", "),
             }
         )
+        # pool spojení musí stačiť na všetky súbežné requesty (rovnako aj record/replay adaptér)
+        self.adapter_kwargs = {"pool_connections": 4, "pool_maxsize": max(1, concurrency)}
+        adapter = HTTPAdapter(**self.adapter_kwargs)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.timeout = timeout
-        self.min_sleep = min_sleep
-        self.max_sleep = max_sleep
+        self.concurrency = max(1, concurrency)
         self.max_retries = max_retries
         self.backoff_base = backoff_base
         self.backoff_jitter_min = backoff_jitter_min
@@ -52,23 +84,61 @@ class HttpClient:
         self.max_requests_per_run = max_requests_per_run
         self.storage_http_meta = storage_http_meta
         self.log = logger
+        # voliteľný ResponseCache – surové telá odpovedí (200) na disku
+        self.response_cache = response_cache
+        # record/replay: vždy plné odpovede, http_meta sa nečíta ani nezapisuje
+        self.conditional_enabled = conditional_enabled
+        # token bucket na host – čaká sa iba pri prázdnom buckete (aj pri retry)
+        self.limiter = HostRateLimiter(host_rps, host_burst)
         self._request_count = 0
+        self._count_lock = threading.Lock()
+        self.stats = HttpStats()
+        # Storage zdieľa jedno DB spojenie – meta prístupy z vlákien serializujeme
+        self._meta_lock = threading.Lock()
 
     @property
     def request_count(self) -> int:
         return self._request_count
 
-    def _sleep_human(self, extra_min: float = 0.0, extra_max: float = 0.0) -> None:
-        lo = self.min_sleep + extra_min
-        hi = self.max_sleep + extra_max
-        delay = random.uniform(lo, hi)
-        time.sleep(delay)
+    def reset_request_count(self) -> None:
+        """
+        Nový rozpočet MAX_REQUESTS_PER_RUN (daemon ho obnovuje pre každý cieľ).
+        """
+        with self._count_lock:
+            self._request_count = 0
+
+    @property
+    def rate_wait_seconds(self) -> float:
+        return self.limiter.wait_seconds
+
+    def _account(self, resp: requests.Response, elapsed: float) -> int:
+        """
+        Zapíše bajty a latenciu odpovede do `stats`. Vracia prenesené bajty.
+        """
+        body = len(resp.content or b"")
+        # urllib3 tell() = počet prečítaných bajtov ešte pred dekompresiou
+        tell = getattr(resp.raw, "tell", None)
+        try:
+            wire = int(tell()) if tell else body
+        except Exception:
+            wire = body
+        with self._count_lock:
+            self.stats.responses += 1
+            self.stats.wire_bytes += wire
+            self.stats.body_bytes += body
+            self.stats.elapsed += elapsed
+        return wire
+
+    def _reserve_request(self) -> None:
+        with self._count_lock:
+            if self._request_count >= self.max_requests_per_run:
+                raise RequestLimitExceeded(f"Hard limit requestov prekročený: {self.max_requests_per_run}")
+            self._request_count += 1
 
     def get(
         self,
         url: str,
         *,
-        extra_sleep: bool = False,
         allow_redirects: bool = True,
         extra_headers: dict | None = None,
         conditional: bool = True,
@@ -80,11 +150,14 @@ class HttpClient:
         if self._request_count >= self.max_requests_per_run:
             raise RequestLimitExceeded(f"Hard limit requestov prekročený: {self.max_requests_per_run}")
 
+        conditional = conditional and self.conditional_enabled
         headers: dict[str, str] = {}
+        meta = None
 
         # conditional headers (etag/last-modified)
         if conditional:
-            meta = self.storage_http_meta.get_meta(url)
+            with self._meta_lock:
+                meta = self.storage_http_meta.get_meta(url)
             if meta:
                 if meta.get("etag"):
                     headers["If-None-Match"] = meta["etag"]
@@ -102,21 +175,27 @@ class HttpClient:
         attempt = 0
         while True:
             attempt += 1
-            self._request_count += 1
-
-            if extra_sleep:
-                self._sleep_human(extra_min=2.0, extra_max=6.0)
-            else:
-                self._sleep_human()
+            self._reserve_request()
+            self.limiter.acquire(url)
 
             try:
+                t0 = time.perf_counter()
                 resp = self.session.get(url, headers=headers, timeout=self.timeout, allow_redirects=allow_redirects)
+                elapsed = time.perf_counter() - t0
+                wire = self._account(resp, elapsed)
                 status = resp.status_code
 
                 # 304 – unchanged
                 if status == 304:
                     self.log.info(f"304 Not Modified – preskakujem: {url}")
-                    return HttpResult(url=url, status_code=status, text=None, headers=dict(resp.headers))
+                    return HttpResult(
+                        url=url,
+                        status_code=status,
+                        text=None,
+                        headers=dict(resp.headers),
+                        elapsed=elapsed,
+                        wire_bytes=wire,
+                    )
 
                 # retry statuses
                 if status in (429, 503, 502, 504):
@@ -126,15 +205,26 @@ class HttpClient:
 
                 resp.raise_for_status()
 
-                # store meta only when conditional flow is on (má zmysel caching)
-                if conditional:
-                    self.storage_http_meta.upsert_meta(
-                        url=url,
-                        etag=resp.headers.get("ETag"),
-                        last_modified=resp.headers.get("Last-Modified"),
-                    )
+                h = body_hash(resp.content)
+                if self.response_cache is not None:
+                    self.response_cache.put(url, status, dict(resp.headers), resp.content, h=h)
+
+                # meta (etag/last-modified/hash) sa NEukladá tu, ale až cez remember()
+                # po úspešnom spracovaní – inak by zlyhaný parse vyzeral navždy ako "nezmenené"
+                unchanged = bool(conditional and meta and meta.get("content_hash") == h)
+                if unchanged:
+                    self.log.info(f"Obsah nezmenený (hash) – preskakujem: {url}")
 
-                return HttpResult(url=url, status_code=status, text=resp.text, headers=dict(resp.headers))
+                return HttpResult(
+                    url=url,
+                    status_code=status,
+                    text=resp.text,
+                    headers=dict(resp.headers),
+                    body_hash=h,
+                    unchanged=unchanged,
+                    elapsed=elapsed,
+                    wire_bytes=wire,
+                )
 
             except requests.RequestException as e:
                 if attempt <= self.max_retries:
@@ -142,6 +232,79 @@ class HttpClient:
                     continue
                 raise
 
+    def remember(self, res: HttpResult) -> None:
+        """
+        Zapamätá si ETag/Last-Modified/hash spracovanej odpovede pre ďalší conditional GET.
+        """
+        if not self.conditional_enabled or res.status_code != 200:
+            return
+        with self._meta_lock:
+            self.storage_http_meta.upsert_meta(
+                url=res.url,
+                etag=res.headers.get("ETag"),
+                last_modified=res.headers.get("Last-Modified"),
+                content_hash=res.body_hash,
+            )
+
+    def get_many(
+        self,
+        urls: Iterable[str],
+        *,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> Iterator[tuple[str, HttpResult | Exception]]:
+        """
+        Stiahne viac URL súbežne (max `concurrency` requestov naraz) cez `get()`.
+        Výsledky vracia v poradí dokončenia ako (url, HttpResult).
+
+        Tempo určuje per-host rate limiter, nie počet vlákien. Keď niektorý request zlyhá
+        (napr. RequestLimitExceeded), ďalšie sa už nespúšťajú, rozbehnuté sa dokončia
+        a výnimka sa vyhodí až po ich odovzdaní volajúcemu.
+
+        - return_exceptions: sieťové chyby (requests.RequestException po všetkých retry)
+          sa vrátia ako (url, výnimka) a pokračuje sa ďalej; RequestLimitExceeded vždy zastaví
+        """
+        pending_urls = list(urls)
+        if not pending_urls:
+            return
+
+        error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="http") as pool:
+            in_flight: dict[Future, str] = {}
+            queue = iter(pending_urls)
+
+            def submit_next() -> bool:
+                u = next(queue, None)
+                if u is None:
+                    return False
+                in_flight[pool.submit(self.get, u, **kwargs)] = u
+                return True
+
+            for _ in range(self.concurrency):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    u = in_flight.pop(fut)
+                    exc = fut.exception()
+                    if return_exceptions and isinstance(exc, requests.RequestException):
+                        if error is None:
+                            submit_next()
+                        yield u, exc
+                        continue
+                    if exc is not None:
+                        if error is None:
+                            error = exc
+                        continue
+                    if error is None:
+                        submit_next()
+                    yield u, fut.result()
+
+        if error is not None:
+            raise error
+
     def _backoff(self, attempt: int, status: Optional[int], url: str, exc: Exception | None = None) -> None:
         base = self.backoff_base ** (attempt - 1)
         jitter = random.uniform(self.backoff_jitter_min, self.backoff_jitter_max)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+
+@dataclass
+class RateLimitStats:
+    acquired: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """
+    Klasický token bucket: `rate` tokenov za sekundu, najviac `capacity` naraz.
+    Nie je thread-safe – zamyká ho HostRateLimiter.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        Zoberie 1 token a vráti, koľko sekúnd treba počkať, kým bude reálne k dispozícii.
+        Tokeny môžu ísť do mínusu – súbežní volajúci sa tak zoradia za sebou.
+        """
+        if self.rate <= 0:
+            return 0.0
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+        self.tokens -= 1.0
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """
+    Rate limiter s jedným token bucketom na host.
+    Čaká iba vtedy, keď je bucket prázdny; celkový čas čakania je v `stats`.
+    """
+
+    def __init__(self, default_rate: float, default_burst: float = 1.0) -> None:
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        if "://" in url_or_host:
+            return (urlsplit(url_or_host).hostname or "").lower()
+        return url_or_host.lower()
+
+    def set_rate(self, url_or_host: str, rate: float, burst: float | None = None) -> None:
+        host = self._host(url_or_host)
+        with self._lock:
+            self._buckets[host] = TokenBucket(rate, self.default_burst if burst is None else burst)
+
+    def rate_for(self, url_or_host: str) -> float:
+        host = self._host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            return bucket.rate if bucket else self.default_rate
+
+    def acquire(self, url: str) -> float:
+        """
+        Počká na token pre host danej URL. Vracia počet sekúnd, ktoré sa čakalo.
+        """
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.default_rate, self.default_burst)
+            delay = bucket.reserve(time.monotonic())
+
+            st = self._stats.setdefault(host, RateLimitStats())
+            st.acquired += 1
+            if delay > 0:
+                st.waits += 1
+                st.wait_seconds += delay
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    @property
+    def stats(self) -> dict[str, RateLimitStats]:
+        with self._lock:
+            return {h: RateLimitStats(s.acquired, s.waits, s.wait_seconds) for h, s in self._stats.items()}
+
+    @property
+    def wait_seconds(self) -> float:
+        with self._lock:
+            return sum(s.wait_seconds for s in self._stats.values())
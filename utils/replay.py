@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from utils.response_cache import ResponseCache
+
+# tieto hlavičky popisujú pôvodný prenos, nie uložené (už dekódované) telo
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Normálny HTTPAdapter, ktorý každú odpoveď (okrem 304 bez tela) uloží do ResponseCache.
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        if resp.status_code != 304:
+            self.cache.put(request.url, resp.status_code, dict(resp.headers), resp.content)
+        return resp
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adaptér, ktorý na sieť vôbec nechodí – odpovede servíruje z nahrávky.
+    Neznáma URL dostane 404.
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        cached = self.cache.get(request.url)
+        if cached is None:
+            status, headers, body = 404, {"Content-Type": "text/plain"}, b""
+        else:
+            status = cached.status_code
+            headers = {k: v for k, v in cached.headers.items() if k.lower() not in _HOP_HEADERS}
+            body = cached.body
+
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+def install_recorder(session: requests.Session, record_dir: Path, **adapter_kwargs) -> ResponseCache:
+    """
+    `adapter_kwargs` idú do HTTPAdapter (pool_maxsize podľa súbežnosti klienta).
+    """
+    cache = ResponseCache(Path(record_dir), max_bytes=0)
+    adapter = RecordingAdapter(cache, **adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return cache
+
+
+def is_recording(replay_dir: Path) -> bool:
+    """
+    Je v adresári nahrávka z --record (index ResponseCache)?
+    """
+    return (Path(replay_dir) / ResponseCache.INDEX_NAME).exists()
+
+
+def install_replay(session: requests.Session, replay_dir: Path, **adapter_kwargs) -> ResponseCache:
+    replay_dir = Path(replay_dir)
+    if not is_recording(replay_dir):
+        raise FileNotFoundError(f"Nahrávka neexistuje: {replay_dir}")
+    cache = ResponseCache(replay_dir, max_bytes=0)
+    adapter = ReplayAdapter(cache, **adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return cache
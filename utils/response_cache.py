@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status_code: int
+    headers: dict
+    body: bytes
+    body_hash: str
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(_charset(self.headers), errors="replace")
+
+
+def _charset(headers: dict) -> str:
+    ctype = ""
+    for k, v in (headers or {}).items():
+        if k.lower() == "content-type":
+            ctype = v or ""
+            break
+    for part in ctype.split(";"):
+        part = part.strip()
+        if part.lower().startswith("charset="):
+            return part.split("=", 1)[1].strip("\"' ") or "utf-8"
+    return "utf-8"
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha256(body or b"").hexdigest()
+
+
+class ResponseCache:
+    """
+    Lokálny content-addressed store surových odpovedí (HTML/JSON).
+
+    - telo odpovede je uložené raz pod svojím sha256 (objects/ab/abcd….gz, gzip)
+    - index.json mapuje URL -> hash + status + headers + čas stiahnutia
+    - eviction: LRU podľa posledného prístupu, kým celková veľkosť objektov > max_bytes
+      (max_bytes <= 0 = bez limitu)
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, root: Path, max_bytes: int = 0) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._objects = self.root / "objects"
+        self._index_path = self.root / self.INDEX_NAME
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, dict] = self._load_index()
+
+    # --- index ---
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = self._index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._index, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+            self._dirty = False
+
+    def _object_path(self, h: str) -> Path:
+        return self._objects / h[:2] / f"{h}.gz"
+
+    # --- API ---
+    def put(
+        self,
+        url: str,
+        status_code: int,
+        headers: dict,
+        body: bytes,
+        h: str | None = None,
+    ) -> tuple[str, bool]:
+        """
+        Uloží odpoveď. Vracia (body_hash, changed) – changed=False, ak URL už mala
+        presne toto telo (parsovanie a zápis do DB sa dá preskočiť).
+        `h` = už vypočítaný sha256 tela (ušetrí druhé hashovanie).
+        """
+        h = h or body_hash(body)
+        path = self._object_path(h)
+        now = time.time()
+
+        with self._lock:
+            prev = self._index.get(url)
+            changed = not prev or prev.get("hash") != h
+
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                with gzip.open(tmp, "wb", compresslevel=6) as f:
+                    f.write(body or b"")
+                os.replace(tmp, path)
+
+            self._index[url] = {
+                "hash": h,
+                "status": status_code,
+                "headers": dict(headers or {}),
+                "fetched_at": now,
+                "last_access": now,
+                "size": path.stat().st_size,
+            }
+            self._dirty = True
+            self._evict()
+
+        return h, changed
+
+    def get(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry:
+                return None
+            try:
+                with gzip.open(self._object_path(entry["hash"]), "rb") as f:
+                    body = f.read()
+            except OSError:
+                # objekt zmizol (ručné mazanie) – index položku zahodíme
+                self._index.pop(url, None)
+                self._dirty = True
+                return None
+            entry["last_access"] = time.time()
+            self._dirty = True
+
+        return CachedResponse(
+            url=url,
+            status_code=int(entry.get("status") or 200),
+            headers=entry.get("headers") or {},
+            body=body,
+            body_hash=entry["hash"],
+            fetched_at=float(entry.get("fetched_at") or 0.0),
+        )
+
+    def hash_for(self, url: str) -> str | None:
+        with self._lock:
+            entry = self._index.get(url)
+            return entry["hash"] if entry else None
+
+    def urls(self) -> list[str]:
+        with self._lock:
+            return list(self._index)
+
+    def iter_cached(self) -> Iterator[CachedResponse]:
+        """
+        Prejde všetky uložené odpovede – napr. na opätovné parsovanie bez sťahovania.
+        """
+        for url in self.urls():
+            res = self.get(url)
+            if res is not None:
+                yield res
+
+    # --- eviction ---
+    def _evict(self) -> None:
+        if self.max_bytes <= 0:
+            return
+
+        sizes: dict[str, int] = {}
+        for e in self._index.values():
+            sizes[e["hash"]] = int(e.get("size") or 0)
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        refs: dict[str, int] = {}
+        for e in self._index.values():
+            refs[e["hash"]] = refs.get(e["hash"], 0) + 1
+
+        for url, e in sorted(self._index.items(), key=lambda kv: kv[1].get("last_access") or 0.0):
+            if total <= self.max_bytes:
+                break
+            del self._index[url]
+            h = e["hash"]
+            refs[h] -= 1
+            if refs[h] == 0:
+                total -= sizes.get(h, 0)
+                try:
+                    self._object_path(h).unlink()
+                except OSError:
+                    pass
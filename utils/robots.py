@@ -1,25 +1,277 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
 import urllib.robotparser
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
 
 @dataclass
 class RobotsPolicy:
     allowed: bool
     reason: str
 
+
+@dataclass
+class _Rule:
+    allow: bool
+    pattern: str
+    regex: Optional[re.Pattern]  # None = čistý prefix bez * a $
+
+
+class CompiledRobotsRules:
+    """
+    Allow/Disallow pravidlá jednej user-agent skupiny skompilované do prefixového stromu.
+
+    Sémantika podľa RFC 9309 (ako Google): podporuje `*` a `$`, vyhráva najdlhší
+    zhodujúci sa pattern, pri rovnakej dĺžke Allow. Strom je podľa literálneho
+    prefixu patternu (po prvé `*`/`$`), takže pre URL sa prechádza iba jeho cesta
+    a regex sa skúša len pri pravidlách, ktorých prefix sedí.
+    """
+
+    def __init__(self, rules: Iterable[tuple[bool, str]]) -> None:
+        self._root: dict = {}
+        self.size = 0
+        for allow, pattern in rules:
+            if not pattern:
+                continue
+            self._add(_Rule(allow, pattern, self._compile(pattern)))
+
+    @staticmethod
+    def _compile(pattern: str) -> Optional[re.Pattern]:
+        if "*" not in pattern and not pattern.endswith("$"):
+            return None
+        anchored = pattern.endswith("$")
+        body = pattern[:-1] if anchored else pattern
+        rx = ".*".join(re.escape(part) for part in body.split("*"))
+        return re.compile(rx + ("$" if anchored else ""), re.DOTALL)
+
+    def _add(self, rule: _Rule) -> None:
+        literal = re.split(r"[*$]", rule.pattern, maxsplit=1)[0]
+        node = self._root
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(rule)
+        self.size += 1
+
+    def is_allowed(self, path: str) -> bool:
+        best_len = -1
+        best_allow = True
+        node = self._root
+        i = 0
+        while node is not None:
+            for rule in node.get(None, ()):
+                if rule.regex is None or rule.regex.match(path):
+                    n = len(rule.pattern)
+                    if n > best_len or (n == best_len and rule.allow):
+                        best_len = n
+                        best_allow = rule.allow
+            if i >= len(path):
+                break
+            node = node.get(path[i])
+            i += 1
+        return best_allow
+
+
+def _parse_rules(robots_txt: str, user_agent: str) -> list[tuple[bool, str]]:
+    """
+    Vyberie Allow/Disallow pravidlá skupiny pre náš user-agent (inak skupiny "*").
+    """
+    token = user_agent.split("/", 1)[0].strip().lower()
+
+    groups: list[tuple[list[str], list[tuple[bool, str]]]] = []
+    agents: list[str] = []
+    rules: list[tuple[bool, str]] = []
+    in_rules = False
+
+    for raw in robots_txt.splitlines():
+        line = raw.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, value = (x.strip() for x in line.split(":", 1))
+        key = key.lower()
+
+        if key == "user-agent":
+            if in_rules:
+                groups.append((agents, rules))
+                agents, rules = [], []
+                in_rules = False
+            agents.append(value.lower())
+        elif key in ("allow", "disallow"):
+            in_rules = True
+            rules.append((key == "allow", value))
+        else:
+            in_rules = in_rules or bool(agents)
+
+    if agents:
+        groups.append((agents, rules))
+
+    specific = [r for a, r in groups if any(x != "*" and x in token for x in a)]
+    if specific:
+        return [x for r in specific for x in r]
+    return [x for a, r in groups if "*" in a for x in r]
+
+
+def _path_of(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
 class RobotsChecker:
     def __init__(self, user_agent: str) -> None:
         self.user_agent = user_agent
         self._rp: Optional[urllib.robotparser.RobotFileParser] = None
+        self._rules: Optional[CompiledRobotsRules] = None
+        self._decisions: dict[str, bool] = {}
 
     def load(self, robots_txt: str, robots_url: str) -> None:
         rp = urllib.robotparser.RobotFileParser()
         rp.set_url(robots_url)
         rp.parse(robots_txt.splitlines())
         self._rp = rp
+        self._rules = CompiledRobotsRules(_parse_rules(robots_txt, self.user_agent))
+        self._decisions = {}
 
     def can_fetch(self, url: str) -> RobotsPolicy:
-        if not self._rp:
+        if not self._rules:
             return RobotsPolicy(False, "robots.txt nie je načítaný – bezpečne blokujem requesty.")
-        ok = self._rp.can_fetch(self.user_agent, url)
+        path = _path_of(url)
+        ok = self._decisions.get(path)
+        if ok is None:
+            ok = path == "/robots.txt" or self._rules.is_allowed(path)
+            self._decisions[path] = ok
         return RobotsPolicy(ok, "Povolené robots.txt" if ok else "Zakázané robots.txt")
+
+    def filter_allowed(self, urls: Iterable[str]) -> list[str]:
+        return [u for u in urls if self.can_fetch(u).allowed]
+
+    def crawl_delay(self) -> Optional[float]:
+        if not self._rp:
+            return None
+        delay = self._rp.crawl_delay(self.user_agent)
+        return float(delay) if delay else None
+
+    def request_rate(self) -> Optional[float]:
+        """
+        Request-rate: N/S -> N/S requestov za sekundu (None, ak direktíva chýba).
+        """
+        if not self._rp:
+            return None
+        rr = self._rp.request_rate(self.user_agent)
+        if not rr or not rr.seconds:
+            return None
+        return rr.requests / rr.seconds
+
+    def max_rps(self) -> Optional[float]:
+        """
+        Najprísnejší limit z Crawl-delay a Request-rate (requests/s) alebo None.
+        """
+        limits = []
+        delay = self.crawl_delay()
+        if delay:
+            limits.append(1.0 / delay)
+        rate = self.request_rate()
+        if rate:
+            limits.append(rate)
+        return min(limits) if limits else None
+
+
+def fetch_robots(http, url: str, validators: dict | None = None):
+    """
+    robots.txt cez zdieľaný HttpClient (keep-alive, retry, počítadlo requestov).
+    Vracia HttpResult alebo None pri sieťovej chybe.
+    """
+    headers = {"Accept": "text/plain,*/*;q=0.8"}
+    headers.update(validators or {})
+    try:
+        return http.get(url, conditional=False, extra_headers=headers)
+    except requests.RequestException:
+        return None
+
+
+class RobotsCache:
+    """
+    robots.txt perzistovaný na disku (text + `<meno>.json` s časom stiahnutia a validátormi).
+
+    - kým je kópia mladšia ako TTL, nejde sa na sieť vôbec
+    - po TTL sa revaliduje conditional GET-om (304 = iba posunie čas stiahnutia)
+    - keď web nie je dostupný, použije sa posledná kópia bez ohľadu na vek
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float) -> None:
+        self.path = Path(path)
+        self.meta_path = self.path.with_suffix(".json")
+        self.ttl_seconds = ttl_seconds
+
+    def _read(self) -> tuple[str | None, dict]:
+        try:
+            text = self.path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None, {}
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        return text, meta if isinstance(meta, dict) else {}
+
+    def _write_meta(self, meta: dict) -> None:
+        tmp = self.meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.meta_path)
+
+    def _write(self, text: str, meta: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(text + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._write_meta(meta)
+
+    def load(self, http, url: str, logger) -> str | None:
+        text, meta = self._read()
+        age = time.time() - float(meta.get("fetched_at") or 0.0)
+
+        if text and meta.get("url") == url and age < self.ttl_seconds:
+            logger.info(f"robots.txt z cache (vek {age / 3600:.1f} h).")
+            return text
+
+        validators = {}
+        if text and meta.get("url") == url:
+            if meta.get("etag"):
+                validators["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                validators["If-Modified-Since"] = meta["last_modified"]
+
+        res = fetch_robots(http, url, validators)
+
+        if res is not None and res.status_code == 304 and text:
+            meta["fetched_at"] = time.time()
+            self._write_meta(meta)
+            logger.info("robots.txt nezmenený (304) – cache predĺžená.")
+            return text
+
+        fresh = (res.text or "").strip() if res is not None and res.status_code == 200 else ""
+        if fresh:
+            self._write(
+                fresh,
+                {
+                    "url": url,
+                    "fetched_at": time.time(),
+                    "etag": res.headers.get("ETag"),
+                    "last_modified": res.headers.get("Last-Modified"),
+                },
+            )
+            logger.info("robots.txt stiahnutý a uložený do cache.")
+            return fresh
+
+        if text:
+            status = res.status_code if res is not None else "sieťová chyba"
+            logger.warning(f"robots.txt nedostupný ({status}) – používam kópiu z cache (vek {age / 3600:.1f} h).")
+            return text
+        return None